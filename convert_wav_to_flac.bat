@@ -71,8 +71,8 @@ if not exist "%source_path%" (
 
 echo.
 echo Select conversion quality:
-echo 1. High Quality (32-bit, compression level 12) - Best quality, larger files
-echo 2. Compatibility (16-bit, compression level 8) - Better device support
+echo 1. High Quality (24-bit) - Best quality, larger files
+echo 2. Compatibility (16-bit) - Better device support
 echo.
 set /p quality="Enter your choice (1 or 2): "
 
@@ -108,9 +108,9 @@ set command=python wav_to_flac_converter.py "%source_path%" --output "%output_fo
 
 if "%quality%"=="2" (
     set command=%command% --compatibility
-    echo Quality: Compatibility Mode (16-bit, level 8)
+    echo Quality: Compatibility Mode (16-bit)
 ) else (
-    echo Quality: High Quality Mode (32-bit, level 12)
+    echo Quality: High Quality Mode (24-bit)
 )
 
 if "%metadata%"=="2" (
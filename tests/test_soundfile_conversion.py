@@ -0,0 +1,66 @@
+"""Regression tests for in-process (libsndfile) WAV to FLAC conversion."""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import wav_to_flac_converter as converter_module
+
+try:
+    import numpy
+    import soundfile
+except ImportError:
+    numpy = soundfile = None
+
+
+@unittest.skipIf(soundfile is None, "soundfile is not installed")
+class FloatWavConversionTest(unittest.TestCase):
+    """Float WAVs must keep their level; integer reads of float data are not scaled."""
+    
+    PEAK = 0.905
+    
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self._tmp.name)
+        t = numpy.arange(44100) / 44100
+        self.samples = self.PEAK * numpy.sin(2 * numpy.pi * 440 * t)
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def _convert(self, subtype: str, compatibility_mode: bool):
+        wav_file = self.tmp_path / f"{subtype}.wav"
+        flac_file = self.tmp_path / f"{subtype}.flac"
+        soundfile.write(str(wav_file), self.samples, 44100, subtype=subtype)
+        
+        # Only the attributes the encoder reads; avoids the ffmpeg check in __init__
+        converter = object.__new__(converter_module.EnhancedWAVToFLACConverter)
+        converter.compatibility_mode = compatibility_mode
+        converter.compression_level = converter_module.DEFAULT_COMPRESSION_LEVEL
+        converter._convert_with_soundfile(wav_file, flac_file)
+        
+        output, _ = soundfile.read(str(flac_file))
+        return output
+    
+    def test_float_wav_keeps_peak_and_rms(self):
+        expected_rms = numpy.sqrt(numpy.mean(self.samples ** 2))
+        for subtype in ('FLOAT', 'DOUBLE'):
+            for compatibility_mode in (False, True):
+                with self.subTest(subtype=subtype, compatibility_mode=compatibility_mode):
+                    output = self._convert(subtype, compatibility_mode)
+                    self.assertAlmostEqual(numpy.abs(output).max(), self.PEAK, places=3)
+                    self.assertAlmostEqual(numpy.sqrt(numpy.mean(output ** 2)), expected_rms, places=3)
+    
+    def test_over_full_scale_float_is_clipped(self):
+        self.samples = numpy.array([1.5, -1.5, 0.5] * 1000)
+        output = self._convert('FLOAT', compatibility_mode=False)
+        self.assertAlmostEqual(output[0], 1.0, places=4)
+        self.assertAlmostEqual(output[1], -1.0, places=4)
+        self.assertAlmostEqual(output[2], 0.5, places=4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -20,33 +20,63 @@ Features:
 - Detailed logging and progress tracking
 
 Requirements:
-- pydub
 - mutagen
 - musicbrainzngs
 - pyacoustid
-- ffmpeg (for pydub to work with FLAC)
+- soundfile (in-process WAV to FLAC encoding)
+- ffmpeg (fallback encoder and fingerprint decoding)
 
 Usage:
     python wav_to_flac_converter_enhanced.py <source_path> [options]
 """
 
 import os
+import atexit
 import sys
 import argparse
 import re
 import time
+import pickle
+import base64
+import shutil
+import sqlite3
+import struct
+import subprocess
+import hashlib
+import threading
+from enum import IntEnum
+from functools import lru_cache
+from itertools import cycle, islice
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, as_completed, wait
 from pathlib import Path
-from pydub import AudioSegment
-from pydub.utils import which
+import mutagen
 from mutagen.flac import FLAC
 import musicbrainzngs
 import acoustid
-import pylast
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
-from typing import List, Tuple, Dict, Optional, Set
+import logging.handlers
+import queue
+from typing import List, Tuple, Dict, Optional, Set, Iterator, NamedTuple
 from urllib.parse import quote
 from difflib import SequenceMatcher
 
+# Use the C++ rapidfuzz scorer when available
+try:
+    from rapidfuzz import fuzz
+except ImportError:
+    # rapidfuzz not installed, will fall back to difflib.SequenceMatcher
+    fuzz = None
+
+# Encode WAV to FLAC in-process through libsndfile when available
+try:
+    import soundfile
+except ImportError:
+    # soundfile not installed, every conversion will spawn ffmpeg
+    soundfile = None
+
 # Load environment variables from .env file
 try:
     from dotenv import load_dotenv
@@ -55,15 +85,7 @@ except ImportError:
     # dotenv not installed, will fall back to system environment variables
     pass
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('conversion_enhanced.log'),
-        logging.StreamHandler()
-    ]
-)
+# Handlers are attached in main() via setup_logging()
 logger = logging.getLogger(__name__)
 
 # Configure MusicBrainz client
@@ -75,96 +97,615 @@ musicbrainzngs.set_useragent(
 
 # AcoustID API key (free tier)
 ACOUSTID_API_KEY = os.getenv("ACOUSTID_API_KEY", "YOUR_ACOUSTID_API_KEY")  # Get from https://acoustid.org/api-key
+ACOUSTID_LOOKUP_URL = "https://api.acoustid.org/v2/lookup"
+ACOUSTID_BATCH_SIZE = 16  # Fingerprints submitted per AcoustID request
+FINGERPRINT_LENGTH = 120  # Seconds of audio analysed per fingerprint
+FPCALC_BATCH_SIZE = 16  # Most files handed to a single fpcalc process
+
+# Local fingerprint matching, tried before querying AcoustID
+FINGERPRINT_MATCH_BER = 0.35  # Maximum bit error rate for two fingerprints to be the same recording
+FINGERPRINT_MAX_SHIFT = 10  # Misalignment tolerated, in fingerprint items (~0.12 s each)
+FINGERPRINT_DURATION_TOLERANCE = 7  # Seconds of track length difference allowed
 
 # Last.fm API configuration
 LASTFM_API_KEY = os.getenv("LASTFM_API_KEY", "YOUR_LASTFM_API_KEY")  # Get from https://www.last.fm/api
 LASTFM_API_SECRET = os.getenv("LASTFM_API_SECRET", "YOUR_LASTFM_SECRET")  # Optional for read-only operations
+LASTFM_API_URL = "https://ws.audioscrobbler.com/2.0/"
+LASTFM_RATE_LIMIT_BACKOFF = 10  # Seconds to pause Last.fm requests after hitting the limit
+LASTFM_ERROR_RATE_LIMIT = 29  # Last.fm web service error code for "rate limit exceeded"
+LASTFM_ERROR_NOT_FOUND = 6  # "Invalid parameters", returned for an unknown track or artist
+
+
+def _create_http_session() -> requests.Session:
+    """Create a pooled HTTP session so repeated API calls reuse TCP/TLS connections."""
+    session = requests.Session()
+    retries = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 503],
+        allowed_methods=frozenset(['GET', 'POST'])
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retries)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# Shared by all worker threads
+_HTTP_SESSION = _create_http_session()
+
+# Filename patterns that carry no real title information, compiled into a
+# single alternation so each filename is scanned once
+_GENERIC_PATTERNS = (
+    r'^track\s*\d+',                       # "Track 01", "Track01", "track 5"
+    r'^\d+[\s\-_\.]*track\d*',             # "01 Track", "01-Track", "05. Track05"
+    r'^\d+[\s\-_\.]*$',                    # "01", "02", "05."
+    r'^\d+[\s\-_\.]+\d+$',                 # "01 01", "05. 05"
+    r'^track[\s\-_\.]*\d+',                # "Track.01", "Track-05"
+    r'^\d+[\s\-_\.]*(track|titulo|cancion|song)', # Multi-language
+    r'^(track|titulo|cancion|song)[\s\-_\.]*\d+',  # "Song 01", "Cancion 02"
+    r'untitled[\s\-_]*\d*',
+    r'^audio[\s\-_]*\d+',                  # "Audio 01"
+    r'^pista[\s\-_]*\d+',                  # Spanish: "Pista 01"
+)
+_GENERIC_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in _GENERIC_PATTERNS), re.IGNORECASE)
+
+# Metadata keys written to FLAC Vorbis comments, in order ('year' overrides 'date')
+_STD_TAG_MAP = (
+    ('title', 'TITLE'),
+    ('artist', 'ARTIST'),
+    ('album', 'ALBUM'),
+    ('date', 'DATE'),
+    ('year', 'DATE'),
+    ('track_number', 'TRACKNUMBER'),
+    ('genre', 'GENRE'),
+    ('albumartist', 'ALBUMARTIST'),
+    ('composer', 'COMPOSER'),
+    ('comment', 'COMMENT'),
+)
+_MB_TAG_MAP = (
+    ('musicbrainz_recordingid', 'MUSICBRAINZ_TRACKID'),
+    ('musicbrainz_albumid', 'MUSICBRAINZ_ALBUMID'),
+    ('musicbrainz_artistid', 'MUSICBRAINZ_ARTISTID'),
+    ('musicbrainz_releasegroupid', 'MUSICBRAINZ_RELEASEGROUPID'),
+)
+
+# Track number patterns, tried in order of preference
+_TRACK_NUMBER_RES = (
+    re.compile(r'^(\d+)[\s\-_\.]*'),   # Leading number
+    re.compile(r'track[\s\-_]*(\d+)'),  # "Track NN"
+    re.compile(r'(\d+)[\s\-_]*track'),  # "NN Track"
+)
+
+# Track number / "Track" prefixes stripped from generic titles
+_GENERIC_PREFIX_RE = re.compile(r'^(\d+[\s\-_\.]*)|(track[\s\-_]*\d*[\s\-_]*)', re.IGNORECASE)
+_LEADING_NUMBER_RE = re.compile(r'^\d+[\s\-_\.]*')
+
+# Year patterns in album directory names, as (pattern, year is in group 1)
+_YEAR_RES = (
+    (re.compile(r'\b(19|20)\d{2}\b'), False),  # Standard 4-digit year
+    (re.compile(r'\((\d{4})\)'), True),         # Year in parentheses
+    (re.compile(r'\[(\d{4})\]'), True),         # Year in brackets
+)
+# Separators left behind once the year is removed from an album name
+_ALBUM_CLEAN_RE = re.compile(r'\s*[-_\(\)\[\]]\s*')
+
+# Persistent lookup cache shared across runs
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "wav_to_flac" / "metadata.sqlite"
+CACHE_TTL = 30 * 24 * 60 * 60  # Re-query online databases after 30 days
+PREFETCH_BYTES = 64 * 1024 * 1024  # Start of each upcoming input hinted into the page cache
+
+# FLAC compression: 0-8 are the reference encoder's presets (ffmpeg also accepts
+# up to 12). Above 5 the LPC search gets much slower for a file that is
+# typically under 1% smaller.
+DEFAULT_COMPRESSION_LEVEL = 5
+MAX_COMPRESSION_LEVEL = 12
+LIBSNDFILE_MAX_COMPRESSION_LEVEL = 8
+
+# Characters with special meaning in MusicBrainz (Lucene) search queries
+_LUCENE_SPECIAL_RE = re.compile(r'([+\-&|!(){}\[\]^"~*?:\\/])')
+
+
+def _lucene_escape(text: str) -> str:
+    """Escape Lucene query syntax so user text is searched literally."""
+    return _LUCENE_SPECIAL_RE.sub(r'\\\1', text)
+
+
+@lru_cache(maxsize=4096)
+def _generic_match(filename: str) -> Optional[str]:
+    """Return the generic pattern text matched by a filename, or None."""
+    match = _GENERIC_RE.search(filename.strip())
+    return match.group(0) if match else None
+
+
+@lru_cache(maxsize=4096)
+def _track_number_from_filename(filename: str) -> Optional[int]:
+    """Extract a track number from a filename."""
+    filename_lower = filename.lower()
+    for pattern in _TRACK_NUMBER_RES:
+        match = pattern.search(filename_lower)
+        if match:
+            try:
+                return int(match.group(1))
+            except ValueError:
+                continue
+    return None
+
+
+def _ratio(a: str, b: str) -> float:
+    """Similarity ratio between two strings, from 0.0 to 1.0; callers lowercase both sides once."""
+    if fuzz is not None:
+        return fuzz.ratio(a, b) / 100.0
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def _cache_key(kind: str, *parts: str) -> int:
+    """
+    Build a compact 64-bit cache key from a lookup kind and its (case-insensitive) inputs.
+    
+    Unlike hash(), the digest is stable across runs, so it can index the
+    persistent store directly as an INTEGER primary key.
+    """
+    raw = '|'.join((kind,) + parts).lower().encode('utf-8')
+    return int.from_bytes(hashlib.blake2b(raw, digest_size=8).digest(), 'big', signed=True)
+
+
+def _unpack_bits(data: bytes, width: int) -> List[int]:
+    """Unpack a little-endian stream of `width`-bit unsigned integers."""
+    values = []
+    mask = (1 << width) - 1
+    acc = bits = 0
+    for byte in data:
+        acc |= byte << bits
+        bits += 8
+        while bits >= width:
+            values.append(acc & mask)
+            acc >>= width
+            bits -= width
+    return values
+
+
+def _decode_fingerprint(fingerprint: str) -> Optional[List[int]]:
+    """
+    Decode a compressed Chromaprint fingerprint (as printed by fpcalc) into its 32-bit items.
+    
+    Mirrors chromaprint's FingerprintDecompressor: after a 4-byte header
+    (algorithm, item count), each item is XOR-delta coded as 3-bit gaps between
+    set bits, terminated by 0, with gaps of 7 or more extended by 5-bit values
+    stored after the 3-bit stream.
+    """
+    try:
+        data = base64.urlsafe_b64decode(fingerprint + '=' * (-len(fingerprint) % 4))
+    except (ValueError, TypeError):
+        return None
+    if len(data) < 4:
+        return None
+    
+    num_items = int.from_bytes(data[1:4], 'big')
+    gaps = _unpack_bits(data[4:], 3)
+    found = exceptional = 0
+    for end, gap in enumerate(gaps):
+        if gap == 0:
+            found += 1
+            if found == num_items:
+                break
+        elif gap == 7:
+            exceptional += 1
+    else:
+        return None
+    gaps = gaps[:end + 1]
+    
+    if exceptional:
+        offset = 4 + (len(gaps) * 3 + 7) // 8
+        extra = _unpack_bits(data[offset:], 5)
+        if len(extra) < exceptional:
+            return None
+        extra_iter = iter(extra)
+        gaps = [gap + next(extra_iter) if gap == 7 else gap for gap in gaps]
+    
+    items = []
+    previous = value = last_bit = 0
+    for gap in gaps:
+        if gap == 0:
+            previous ^= value
+            items.append(previous)
+            value = last_bit = 0
+        else:
+            last_bit += gap
+            value |= 1 << (last_bit - 1)
+    return items
+
+
+def _pack_fingerprint(items: List[int]) -> Tuple[int, int]:
+    """Pack decoded 32-bit fingerprint items into one integer (item i at bit 32*i), with the item count."""
+    return int.from_bytes(struct.pack(f'<{len(items)}I', *items), 'little'), len(items)
+
+
+# int.bit_count() is Python 3.10+; bin().count() is the slower but equivalent fallback
+_popcount = getattr(int, 'bit_count', None) or (lambda value: bin(value).count('1'))
+
+
+def _fingerprint_ber(a: Tuple[int, int], b: Tuple[int, int], max_shift: int = FINGERPRINT_MAX_SHIFT) -> float:
+    """
+    Lowest bit error rate between two packed fingerprints over small relative shifts.
+    
+    Each alignment is one XOR and popcount over the overlapping window of the
+    packed integers, rather than a Python loop over individual items.
+    """
+    a_bits, a_len = a
+    b_bits, b_len = b
+    best = 1.0
+    min_overlap = min(a_len, b_len) // 2
+    for shift in range(-max_shift, max_shift + 1):
+        start_a = max(0, shift)
+        start_b = max(0, -shift)
+        overlap = min(a_len - start_a, b_len - start_b)
+        if overlap <= 0 or overlap < min_overlap:
+            continue
+        mask = (1 << (32 * overlap)) - 1
+        diff = ((a_bits >> (32 * start_a)) ^ (b_bits >> (32 * start_b))) & mask
+        best = min(best, _popcount(diff) / (32 * overlap))
+    return best
+
+
+def _read_flac_tags(file_path: Path) -> Optional[Dict[str, List[str]]]:
+    """
+    Read only the Vorbis comments of a FLAC file.
+    
+    Walks the metadata block headers and seeks past STREAMINFO, PICTURE and
+    other blocks, so embedded cover art is never read. Returns None when the
+    file does not start with a bare FLAC stream marker (e.g. it carries an
+    ID3v2 header), in which case the caller should fall back to mutagen.
+    """
+    tags = {}
+    with open(file_path, 'rb') as f:
+        if f.read(4) != b'fLaC':
+            return None
+        
+        while True:
+            header = f.read(4)
+            if len(header) < 4:
+                return None
+            is_last = header[0] & 0x80
+            block_type = header[0] & 0x7F
+            length = int.from_bytes(header[1:4], 'big')
+            
+            if block_type == 4:  # VORBIS_COMMENT
+                block = f.read(length)
+                vendor_length = struct.unpack_from('<I', block, 0)[0]
+                offset = 4 + vendor_length
+                count = struct.unpack_from('<I', block, offset)[0]
+                offset += 4
+                for _ in range(count):
+                    entry_length = struct.unpack_from('<I', block, offset)[0]
+                    offset += 4
+                    entry = block[offset:offset + entry_length].decode('utf-8', errors='replace')
+                    offset += entry_length
+                    key, sep, value = entry.partition('=')
+                    if sep:
+                        tags.setdefault(key.upper(), []).append(value)
+                return tags
+            
+            if is_last:
+                return tags
+            f.seek(length, os.SEEK_CUR)
+
+
+# Sentinel distinguishing "not cached" from a cached negative result (None)
+_CACHE_MISS = object()
+
+# A tuple so the directory walk can test names with one str.endswith() call
+AUDIO_EXTENSIONS = ('.wav', '.flac')
+
+
+class AudioFileEntry(NamedTuple):
+    """An audio file found by the directory walk."""
+    path: Path
+    relative_parts: Tuple[str, ...]  # Path components relative to the source directory
+    stat: os.stat_result  # Taken during the walk and reused by the later phases
+
+
+def _scan_audio_files(source_path: Path) -> Iterator[AudioFileEntry]:
+    """
+    Recursively yield WAV/FLAC files under source_path, reusing the os.scandir stat.
+    
+    Each directory's Path is built once and joined with the file names, so
+    only the name is parsed per file; the relative_parts tuples share the
+    parent component strings.
+    """
+    pending = [(os.path.abspath(source_path), ())]
+    while pending:
+        directory, parts = pending.pop()
+        
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError as e:
+            logger.warning("Cannot read directory %s: %s", directory, e)
+            continue
+        
+        directory_path = None
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                pending.append((entry.path, parts + (entry.name,)))
+            elif entry.name.lower().endswith(AUDIO_EXTENSIONS):
+                if directory_path is None:
+                    directory_path = Path(directory)
+                try:
+                    yield AudioFileEntry(directory_path / entry.name, parts + (entry.name,), entry.stat())
+                except OSError as e:
+                    logger.warning("Cannot stat %s: %s", entry.path, e)
+
+
+def _shutdown_pool(pool: ThreadPoolExecutor, wait: bool = True):
+    """Shut an executor down, also dropping its queued work on Python 3.9+."""
+    if sys.version_info >= (3, 9):
+        pool.shutdown(wait=wait, cancel_futures=True)
+    else:
+        pool.shutdown(wait=wait)
+
+
+def _fadvise(path: Path, advice: str, length: int = 0):
+    """Best-effort page cache hint (e.g. 'WILLNEED', 'DONTNEED') for a file; a no-op without posix_fadvise."""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, length, getattr(os, 'POSIX_FADV_' + advice))
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+class LastFMError(Exception):
+    """Error response from the Last.fm web service."""
+    
+    def __init__(self, code: int, message: str):
+        super().__init__(f"{code}: {message}")
+        self.code = code
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket.
+    
+    Tokens refill continuously at `rate` per second up to `capacity`; acquire()
+    only blocks when the bucket is empty, so idle time is not wasted sleeping.
+    """
+    
+    def __init__(self, rate: float, capacity: int = 1):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        self._condition = threading.Condition()
+    
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+    
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        with self._condition:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                self._condition.wait((1 - self._tokens) / self.rate)
+    
+    def penalize(self, seconds: float):
+        """Drain the bucket so no token is handed out for at least `seconds` (e.g. a server's Retry-After)."""
+        with self._condition:
+            self._refill()
+            self._tokens = min(self._tokens, 0.0) - seconds * self.rate
+
+
+class CacheStore:
+    """SQLite-backed key/value store that persists lookup results between runs."""
+    
+    def __init__(self, path: Path, ttl: float = CACHE_TTL):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS lookups (key INTEGER PRIMARY KEY, value BLOB, ts REAL)"
+        )
+        # Fingerprints are stored already decoded (packed little-endian 32-bit
+        # items) so loading them needs no per-row Chromaprint decoding; a table
+        # from the older compressed-string layout is dropped and relearned
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(fingerprints)")}
+        if columns and 'packed' not in columns:
+            self._conn.execute("DROP TABLE fingerprints")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS fingerprints "
+            "(key INTEGER PRIMARY KEY, duration REAL, packed BLOB, item_count INTEGER, value BLOB, ts REAL)"
+        )
+        # Drop entries that have outlived the TTL
+        self._conn.execute("DELETE FROM lookups WHERE ts < ?", (time.time() - self.ttl,))
+        self._conn.execute("DELETE FROM fingerprints WHERE ts < ?", (time.time() - self.ttl,))
+        self._conn.commit()
+        atexit.register(self.close)
+    
+    def get(self, key: int, default=None):
+        """Return the cached value for key, or default if it was never stored or has expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM lookups WHERE key = ? AND ts >= ?",
+                (key, time.time() - self.ttl)
+            ).fetchone()
+        if row is None:
+            return default
+        try:
+            return pickle.loads(row[0])
+        except Exception:
+            return default
+    
+    def put(self, key: int, value):
+        """Store a picklable value under key, replacing any previous entry."""
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO lookups (key, value, ts) VALUES (?, ?, ?)",
+                (key, blob, time.time())
+            )
+            self._conn.commit()
+    
+    def put_fingerprint(self, key: int, duration: float, packed: Tuple[int, int], value):
+        """Remember the metadata identified for a packed fingerprint (see _pack_fingerprint)."""
+        bits, item_count = packed
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO fingerprints (key, duration, packed, item_count, value, ts) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, duration, bits.to_bytes(4 * item_count, 'little'), item_count, blob, time.time())
+            )
+            self._conn.commit()
+    
+    def fingerprints(self) -> List[Tuple[int, float, Tuple[int, int], object]]:
+        """Return all unexpired (key, duration, packed fingerprint, value) rows."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, duration, packed, item_count, value FROM fingerprints WHERE ts >= ?",
+                (time.time() - self.ttl,)
+            ).fetchall()
+        entries = []
+        for key, duration, packed, item_count, blob in rows:
+            try:
+                entries.append((key, duration, (int.from_bytes(packed, 'little'), item_count), pickle.loads(blob)))
+            except Exception:
+                continue
+        return entries
+    
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
 
 class AdvancedMetadataLookup:
     """Advanced metadata lookup class with intelligent fallback strategies including audio fingerprinting."""
     
-    def __init__(self, enable_fingerprinting: bool = True):
+    def __init__(self, enable_fingerprinting: bool = True, fpcalc_threads: int = 2,
+                 cache_path: Optional[Path] = None):
         self.cache = {}
         self.album_cache = {}
         self.fingerprint_cache = {}
+        self.chromaprint_cache = {}  # fingerprint cache key -> (duration, raw fingerprint)
         self.lastfm_cache = {}
-        self.rate_limit_delay = 1.1  # MusicBrainz requires 1 request per second
-        self.last_request_time = 0
+        self._directory_cache = {}  # directory parts -> (artist, album, year)
+        self._position_index = {}  # album cache key -> {track position: track}
+        self._cache_store = None
+        if cache_path:
+            try:
+                self._cache_store = CacheStore(cache_path)
+                logger.info("[CACHE] Using persistent lookup cache: %s", cache_path)
+            except Exception as e:
+                logger.warning("[CACHE] Persistent cache disabled due to error: %s", e)
+        # Shared by all worker threads so the limits apply to the whole run
+        self._mb_limiter = RateLimiter(rate=1 / 1.1, capacity=1)  # MusicBrainz requires 1 request per second
+        self._acoustid_limiter = RateLimiter(rate=3.0, capacity=3)  # AcoustID allows 3 requests per second
+        self._lastfm_limiter = RateLimiter(rate=5.0, capacity=5)  # Last.fm allows 5 requests per second
+        self._album_locks = {}  # album cache key -> lock; sibling tracks wait for a single album fetch
+        self._album_locks_lock = threading.Lock()
+        self._fpcalc_threads = max(1, fpcalc_threads)
+        self._fpcalc_semaphore = threading.BoundedSemaphore(self._fpcalc_threads)
         self.enable_fingerprinting = enable_fingerprinting
         self.fingerprint_enabled = enable_fingerprinting
+        self._fpcalc_checked = False
+        self._fpcalc_path = None
+        self._ffmpeg_path = None
+        self._local_fingerprints = None  # [(duration, (packed bits, item count), metadata)], loaded on first use
+        self._local_fingerprints_lock = threading.Lock()
+        self.cancelled = threading.Event()  # Set on Ctrl+C; batch prefetches stop at the next step
+        self.lastfm_enabled = LASTFM_API_KEY != "YOUR_LASTFM_API_KEY"
+        if self.lastfm_enabled:
+            logger.info("[LASTFM] Last.fm API enabled")
+    
+    def _cache_get(self, cache: Dict, key: int):
+        """Look up a key in an in-memory cache, falling back to the persistent store."""
+        if key in cache:
+            return cache[key]
+        if self._cache_store is not None:
+            value = self._cache_store.get(key, _CACHE_MISS)
+            if value is not _CACHE_MISS:
+                cache[key] = value
+            return value
+        return _CACHE_MISS
+    
+    def _cache_put(self, cache: Dict, key: int, value):
+        """Store a lookup result in memory and in the persistent store.
         
-        # Initialize Last.fm API if available
-        self.lastfm_enabled = False
-        try:
-            if LASTFM_API_KEY != "YOUR_LASTFM_API_KEY":
-                self.lastfm_network = pylast.LastFMNetwork(
-                    api_key=LASTFM_API_KEY,
-                    api_secret=LASTFM_API_SECRET
-                )
-                self.lastfm_enabled = True
-                logger.info("[LASTFM] Last.fm API enabled")
-            else:
-                logger.info("[LASTFM] Last.fm API key not configured")
-        except Exception as e:
-            logger.warning(f"[LASTFM] Last.fm API disabled due to error: {e}")
-            self.lastfm_enabled = False
-        
-        # Test AcoustID availability
-        if enable_fingerprinting:
+        Only definitive results should be stored here; transient failures
+        (network errors, missing tools) are cached in memory only.
+        """
+        cache[key] = value
+        if self._cache_store is not None:
             try:
-                # Quick test to see if AcoustID is working
-                logger.info("[ACOUSTID] Audio fingerprinting enabled")
-                self.fingerprint_enabled = True
+                self._cache_store.put(key, value)
             except Exception as e:
-                logger.warning(f"[ACOUSTID] Audio fingerprinting disabled due to error: {e}")
-                self.fingerprint_enabled = False
-        
-        self.generic_patterns = [
-            r'^track\s*\d+',                       # "Track 01", "Track01", "track 5"
-            r'^\d+[\s\-_\.]*track\d*',             # "01 Track", "01-Track", "05. Track05"
-            r'^\d+[\s\-_\.]*$',                    # "01", "02", "05."
-            r'^\d+[\s\-_\.]+\d+$',                 # "01 01", "05. 05"
-            r'^track[\s\-_\.]*\d+',                # "Track.01", "Track-05"
-            r'^\d+[\s\-_\.]*(track|titulo|cancion|song)', # Multi-language
-            r'^(track|titulo|cancion|song)[\s\-_\.]*\d+',  # "Song 01", "Cancion 02"
-            r'untitled[\s\-_]*\d*',
-            r'^audio[\s\-_]*\d+',                  # "Audio 01"
-            r'^pista[\s\-_]*\d+',                  # Spanish: "Pista 01"
-        ]
-    
-    def _rate_limit(self):
-        """Ensure we don't exceed MusicBrainz rate limits."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < self.rate_limit_delay:
-            time.sleep(self.rate_limit_delay - time_since_last)
-        self.last_request_time = time.time()
+                logger.warning("  [CACHE] Could not persist lookup result: %s", e)
+    
+    def _fingerprint_cache_key(self, file_path: Path, stat: Optional[os.stat_result] = None) -> int:
+        """Build a rename-proof cache key from file size, mtime and a hash of the first 64 KiB."""
+        if stat is None:
+            stat = file_path.stat()
+        with open(file_path, 'rb') as f:
+            head_digest = hashlib.sha1(f.read(65536)).hexdigest()
+        return _cache_key('fingerprint', str(stat.st_size), str(int(stat.st_mtime)), head_digest)
+    
+    def _tagged_key(self, source_path: Path) -> int:
+        return _cache_key('tagged', str(source_path))
+    
+    def was_tagged(self, source_path: Path, source_stat: Optional[os.stat_result], output_file: Path) -> bool:
+        """Whether output_file was tagged from this unchanged source on an earlier run and not modified since."""
+        if self._cache_store is None:
+            return False
+        record = self._cache_store.get(self._tagged_key(source_path))
+        if record is None:
+            return False
+        try:
+            if source_stat is None:
+                source_stat = source_path.stat()
+            output_mtime = output_file.stat().st_mtime_ns
+        except OSError:
+            return False
+        return record == (source_stat.st_size, source_stat.st_mtime_ns, output_mtime)
+    
+    def mark_tagged(self, source_path: Path, source_stat: Optional[os.stat_result], output_file: Path):
+        """Record that output_file now carries final metadata for source_path."""
+        if self._cache_store is None:
+            return
+        try:
+            if source_stat is None:
+                source_stat = source_path.stat()
+            record = (source_stat.st_size, source_stat.st_mtime_ns, output_file.stat().st_mtime_ns)
+            self._cache_store.put(self._tagged_key(source_path), record)
+        except Exception as e:
+            logger.warning("  [CACHE] Could not record tagged file: %s", e)
     
     def _is_metadata_complete(self, metadata: Dict[str, str]) -> bool:
-        """Check if metadata is complete enough to skip lookup."""
-        essential_fields = ['title', 'artist', 'album']
-        musicbrainz_fields = ['musicbrainz_recordingid', 'musicbrainz_trackid']
-        
-        # Check if all essential fields are present and not generic
-        for field in essential_fields:
-            if not metadata.get(field) or metadata[field].strip() == '':
-                return False
+        """Check if metadata is complete enough to skip lookup (non-generic title plus a MusicBrainz ID)."""
+        # get_existing_metadata only stores stripped, non-empty values, so plain
+        # truthiness is enough and the chain stops at the first missing tag
+        g = metadata.get
+        if not (g('title') and g('artist') and g('album') and g('musicbrainz_recordingid')):
+            return False
         
         # Check if title appears to be generic
-        title = metadata.get('title', '')
-        if self._is_generic_filename(title):
-            logger.info(f"  [INCOMPLETE] Title '{title}' appears generic")
+        if _generic_match(metadata['title']) is not None:
+            logger.debug("  [INCOMPLETE] Title '%s' appears generic", metadata['title'])
             return False
         
-        # Check if we already have MusicBrainz IDs
-        has_musicbrainz = any(metadata.get(field) for field in musicbrainz_fields)
-        if has_musicbrainz:
-            logger.info(f"  [COMPLETE] Metadata has MusicBrainz ID, skipping lookup")
-            return True
-        
-        # Consider complete if we have good title, artist, and album
-        logger.info(f"  [PARTIAL] Has basic metadata but no MusicBrainz ID")
-        return False
+        return True
     
     def get_existing_metadata(self, file_path: Path) -> Dict[str, str]:
         """Extract existing metadata from audio file."""
@@ -172,7 +713,13 @@ class AdvancedMetadataLookup:
         
         try:
             if file_path.suffix.lower() == '.flac':
-                audio_file = FLAC(str(file_path))
+                tags = _read_flac_tags(file_path)
+                if tags is None:
+                    # Not a plain FLAC stream (e.g. ID3-prefixed) - let mutagen handle it
+                    audio_file = FLAC(str(file_path))
+                    tags = {}
+                    for key, value in (audio_file.tags or []):
+                        tags.setdefault(key.upper(), []).append(value)
                 
                 # Map FLAC tags to our metadata format
                 tag_mapping = {
@@ -190,178 +737,460 @@ class AdvancedMetadataLookup:
                 }
                 
                 for flac_tag, meta_key in tag_mapping.items():
-                    if flac_tag in audio_file:
-                        value = audio_file[flac_tag][0] if isinstance(audio_file[flac_tag], list) else audio_file[flac_tag]
-                        if value and str(value).strip():
-                            metadata[meta_key] = str(value).strip()
+                    values = tags.get(flac_tag)
+                    if values and values[0].strip():
+                        metadata[meta_key] = values[0].strip()
                 
-                logger.info(f"  [EXISTING_META] Found {len(metadata)} metadata fields in FLAC")
+                logger.debug("  [EXISTING_META] Found %s metadata fields in FLAC", len(metadata))
                 
         except Exception as e:
-            logger.warning(f"  [META_READ_ERROR] Could not read existing metadata: {e}")
+            logger.warning("  [META_READ_ERROR] Could not read existing metadata: %s", e)
         
         return metadata
     
-    def audio_fingerprint_lookup(self, file_path: Path) -> Optional[Dict[str, str]]:
+    def _fpcalc_available(self) -> bool:
+        """Check (once per run) whether the Chromaprint fpcalc binary is on PATH."""
+        if not self._fpcalc_checked:
+            # pyacoustid honours the FPCALC environment variable as well
+            self._fpcalc_path = shutil.which(os.environ.get('FPCALC', 'fpcalc'))
+            self._ffmpeg_path = shutil.which('ffmpeg')
+            self._fpcalc_checked = True
+            if not self._fpcalc_path:
+                logger.warning("  [FINGERPRINT] fpcalc not found in PATH. Please ensure Chromaprint is installed.")
+                logger.info("  [FINGERPRINT] Install guide: https://acoustid.org/chromaprint")
+                self.fingerprint_enabled = False
+        return self._fpcalc_path is not None
+    
+    def _generate_fingerprint(self, file_path: Path) -> Tuple[float, str]:
+        """Fingerprint a file and return (duration, fingerprint)."""
+        # fpcalc is CPU- and disk-heavy, so cap how many run at once
+        with self._fpcalc_semaphore:
+            try:
+                duration, fingerprint = self._fingerprint_via_pipe(file_path)
+            except Exception as e:
+                logger.debug("  [FINGERPRINT] Decode pipeline unavailable (%s), running fpcalc on the file", e)
+                duration, fingerprint = acoustid.fingerprint_file(str(file_path), maxlength=FINGERPRINT_LENGTH)
+        if isinstance(fingerprint, bytes):
+            fingerprint = fingerprint.decode('ascii')
+        return duration, fingerprint
+    
+    def _fingerprint_via_pipe(self, file_path: Path) -> Tuple[float, str]:
+        """
+        Fingerprint only the first FINGERPRINT_LENGTH seconds of a file.
+        
+        ffmpeg decodes and resamples just that prefix to raw 11025 Hz mono PCM,
+        which is piped straight into fpcalc. The lookup duration comes from the
+        file header, since fpcalc only ever sees the truncated stream.
+        """
+        if not self._ffmpeg_path or not self._fpcalc_path:
+            raise RuntimeError("ffmpeg or fpcalc not found")
+        
+        audio_info = mutagen.File(str(file_path))
+        if audio_info is None or not audio_info.info.length:
+            raise RuntimeError("could not read track duration")
+        
+        decoder = subprocess.Popen(
+            [self._ffmpeg_path, '-hide_banner', '-loglevel', 'error', '-nostdin',
+             '-i', str(file_path), '-t', str(FINGERPRINT_LENGTH),
+             '-ac', '1', '-ar', '11025', '-f', 's16le', '-'],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        )
+        fpcalc = None
+        try:
+            fpcalc = subprocess.Popen(
+                [self._fpcalc_path, '-format', 's16le', '-rate', '11025', '-channels', '1',
+                 '-length', str(FINGERPRINT_LENGTH), '-'],
+                stdin=decoder.stdout, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            )
+            decoder.stdout.close()  # fpcalc owns the read end now
+            output, _ = fpcalc.communicate(timeout=300)
+        finally:
+            # On a timeout (or any other error) neither child may be left running
+            if fpcalc is not None and fpcalc.poll() is None:
+                fpcalc.kill()
+                fpcalc.wait()
+            if decoder.poll() is None:
+                decoder.kill()
+            decoder.wait()
+        
+        if fpcalc.returncode:
+            raise RuntimeError(f"fpcalc exited with status {fpcalc.returncode}")
+        
+        fingerprint = None
+        for line in output.decode('ascii', errors='replace').splitlines():
+            if line.startswith('FINGERPRINT='):
+                fingerprint = line.split('=', 1)[1].strip()
+        if not fingerprint:
+            raise RuntimeError("fpcalc produced no fingerprint")
+        
+        return audio_info.info.length, fingerprint
+    
+    def _fingerprint_file(self, file_path: Path, cache_key: int) -> Tuple[float, str]:
+        """
+        Fingerprint a file, reusing the result of an earlier attempt or run.
+        
+        Only the AcoustID result is cached under cache_key, and transient
+        lookup failures are not persisted; keeping the raw fingerprint means a
+        retry costs a network request but no second fpcalc run.
+        """
+        raw_key = self._chromaprint_key(cache_key)
+        cached = self._cache_get(self.chromaprint_cache, raw_key)
+        if cached is not _CACHE_MISS:
+            return cached
+        duration, fingerprint = self._generate_fingerprint(file_path)
+        if fingerprint:
+            self._cache_put(self.chromaprint_cache, raw_key, (duration, fingerprint))
+        return duration, fingerprint
+    
+    def _chromaprint_key(self, cache_key: int) -> int:
+        return _cache_key('chromaprint', str(cache_key))
+    
+    def _fpcalc_many(self, file_paths: List[Path]) -> Dict[Path, Tuple[float, str]]:
+        """
+        Fingerprint several files with a single fpcalc process.
+        
+        fpcalc handles its arguments in order, printing a FILE=/DURATION=/
+        FINGERPRINT= block per file (without FILE= when given only one). Files
+        it cannot decode are reported on stderr and left out of the result.
+        """
+        with self._fpcalc_semaphore:
+            result = subprocess.run(
+                [self._fpcalc_path, '-length', str(FINGERPRINT_LENGTH)] + [str(path) for path in file_paths],
+                stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                timeout=300 * len(file_paths)
+            )
+        
+        by_name = {str(path): path for path in file_paths}
+        current = file_paths[0] if len(file_paths) == 1 else None
+        duration = None
+        fingerprints = {}
+        for line in os.fsdecode(result.stdout).splitlines():
+            key, _, value = line.partition('=')
+            if key == 'FILE':
+                current = by_name.get(value)
+                duration = None
+            elif key == 'DURATION':
+                duration = float(value)
+            elif key == 'FINGERPRINT' and current is not None and duration is not None:
+                fingerprints[current] = (duration, value.strip())
+        return fingerprints
+    
+    def _acoustid_lookup(self, params: Dict[str, str]) -> Dict:
+        """POST a lookup to the AcoustID web service over the pooled session and return the JSON response."""
+        data = {
+            'client': ACOUSTID_API_KEY,
+            'format': 'json',
+            'meta': 'recordings releasegroups releases artists',
+        }
+        data.update(params)
+        
+        self._acoustid_limiter.acquire()
+        response = _HTTP_SESSION.post(ACOUSTID_LOOKUP_URL, data=data, timeout=30)
+        response.raise_for_status()
+        payload = response.json()
+        if payload.get('status') != 'ok':
+            raise ValueError(payload.get('error', {}).get('message', 'unexpected AcoustID response'))
+        return payload
+    
+    def _ensure_local_fingerprints(self):
+        """Load previously identified fingerprints from the persistent store; the caller must hold the lock."""
+        if self._local_fingerprints is not None:
+            return
+        self._local_fingerprints = []
+        if self._cache_store is None:
+            return
+        try:
+            rows = self._cache_store.fingerprints()
+        except Exception as e:
+            logger.warning("  [FINGERPRINT] Could not load local fingerprint database: %s", e)
+            return
+        self._local_fingerprints = [(duration, packed, metadata) for _, duration, packed, metadata in rows]
+    
+    def _local_fingerprint_match(self, duration: float, fingerprint: str) -> Optional[Dict[str, str]]:
+        """Identify a fingerprint against recordings already identified by AcoustID, without a network request."""
+        items = _decode_fingerprint(fingerprint)
+        if not items:
+            return None
+        packed = _pack_fingerprint(items)
+        
+        with self._local_fingerprints_lock:
+            self._ensure_local_fingerprints()
+            candidates = [entry for entry in self._local_fingerprints
+                          if abs(entry[0] - duration) <= FINGERPRINT_DURATION_TOLERANCE]
+        
+        for _, known, metadata in candidates:
+            ber = _fingerprint_ber(packed, known)
+            if ber < FINGERPRINT_MATCH_BER:
+                logger.info("  [FINGERPRINT] Matched a previously identified recording locally (BER: %.2f)", ber)
+                match = dict(metadata)
+                match['duration'] = str(duration)
+                return match
+        return None
+    
+    def _remember_fingerprint(self, duration: float, fingerprint: str, metadata: Dict[str, str]):
+        """Add an AcoustID-identified fingerprint to the local fingerprint database."""
+        items = _decode_fingerprint(fingerprint)
+        if not items:
+            return
+        metadata = dict(metadata)
+        packed = _pack_fingerprint(items)
+        with self._local_fingerprints_lock:
+            self._ensure_local_fingerprints()
+            self._local_fingerprints.append((duration, packed, metadata))
+        if self._cache_store is not None:
+            try:
+                self._cache_store.put_fingerprint(_cache_key('fingerprint_db', fingerprint), duration, packed, metadata)
+            except Exception as e:
+                logger.warning("  [CACHE] Could not persist fingerprint: %s", e)
+    
+    def _parse_acoustid_results(self, results: List[Dict], duration: float) -> Optional[Dict[str, str]]:
+        """Extract metadata from the best high-confidence AcoustID result, if any."""
+        for result in results:
+            if result.get('score', 0) > 0.8:  # High confidence threshold
+                recordings = result.get('recordings', [])
+                
+                if recordings:
+                    recording = recordings[0]  # Take best match
+                    
+                    metadata = {
+                        'title': recording.get('title', ''),
+                        'musicbrainz_recordingid': recording.get('id', ''),
+                        'duration': str(duration),
+                        'acoustid_score': str(result.get('score', 0))
+                    }
+                    
+                    # Get artist info
+                    if 'artists' in recording:
+                        artists = recording['artists']
+                        if artists:
+                            metadata['artist'] = artists[0].get('name', '')
+                            metadata['musicbrainz_artistid'] = artists[0].get('id', '')
+                    
+                    # Get release info
+                    if 'releases' in recording:
+                        releases = recording['releases']
+                        if releases:
+                            release = releases[0]
+                            metadata['album'] = release.get('title', '')
+                            metadata['musicbrainz_albumid'] = release.get('id', '')
+                            metadata['date'] = release.get('date', '')
+                            
+                            # Get track number from medium
+                            if 'mediums' in release:
+                                for medium in release['mediums']:
+                                    if 'tracks' in medium:
+                                        for track in medium['tracks']:
+                                            if track.get('id') == recording.get('id'):
+                                                metadata['track_number'] = track.get('position', '')
+                                                break
+                    
+                    logger.info("  [FINGERPRINT_SUCCESS] Identified: %s - %s (Score: %.2f)", metadata.get('artist', ''), metadata.get('title', ''), result.get('score', 0))
+                    return metadata
+        
+        return None
+    
+    def audio_fingerprint_lookup_batch(self, file_paths: List[Path],
+                                       file_stats: Optional[Dict[Path, os.stat_result]] = None
+                                       ) -> Dict[Path, Optional[Dict[str, str]]]:
+        """
+        Identify many files with batched AcoustID requests.
+        
+        Uncached files are fingerprinted in groups of up to FPCALC_BATCH_SIZE
+        per fpcalc process (up to fpcalc_threads processes at once), then
+        looked up ACOUSTID_BATCH_SIZE fingerprints per request.
+        Results are seeded into the fingerprint cache, so later
+        audio_fingerprint_lookup calls for these files are cache hits. Files
+        that fail here are left for the single-file path to retry.
+        """
+        file_stats = file_stats or {}
+        found = {}
+        if not self.fingerprint_enabled or not file_paths:
+            return found
+        
+        uncached = []  # (file_path, cache_key)
+        for file_path in file_paths:
+            try:
+                cache_key = self._fingerprint_cache_key(file_path, file_stats.get(file_path))
+            except OSError as e:
+                logger.warning("  [FINGERPRINT] Cannot read %s: %s", file_path.name, e)
+                continue
+            
+            cached = self._cache_get(self.fingerprint_cache, cache_key)
+            if cached is not _CACHE_MISS:
+                found[file_path] = cached
+            else:
+                uncached.append((file_path, cache_key))
+        
+        if not uncached or not self._fpcalc_available():
+            return found
+        
+        fingerprinted = []  # (file_path, cache_key, duration, fingerprint)
+        to_fingerprint = []
+        for file_path, cache_key in uncached:
+            cached = self._cache_get(self.chromaprint_cache, self._chromaprint_key(cache_key))
+            if cached is not _CACHE_MISS:
+                fingerprinted.append((file_path, cache_key) + cached)
+            else:
+                to_fingerprint.append((file_path, cache_key))
+        
+        if to_fingerprint:
+            # One fpcalc process per group instead of per file, with the groups
+            # spread over the fpcalc threads
+            logger.info("  [FINGERPRINT_BATCH] Fingerprinting %s files", len(to_fingerprint))
+            group_size = min(FPCALC_BATCH_SIZE, -(-len(to_fingerprint) // self._fpcalc_threads))
+            groups = [to_fingerprint[start:start + group_size]
+                      for start in range(0, len(to_fingerprint), group_size)]
+            with ThreadPoolExecutor(max_workers=self._fpcalc_threads) as executor:
+                futures = {executor.submit(self._fpcalc_many, [file_path for file_path, _ in group]): group
+                           for group in groups}
+                for future in as_completed(futures):
+                    if self.cancelled.is_set():
+                        for other in futures:
+                            other.cancel()
+                        return found
+                    group = futures[future]
+                    try:
+                        results = future.result()
+                    except Exception as e:
+                        logger.warning("  [FINGERPRINT] Fingerprinting failed for %s files: %s", len(group), e)
+                        continue
+                    for file_path, cache_key in group:
+                        if file_path not in results:
+                            logger.warning("  [FINGERPRINT] Fingerprinting failed for %s", file_path.name)
+                            continue
+                        self._cache_put(self.chromaprint_cache, self._chromaprint_key(cache_key), results[file_path])
+                        fingerprinted.append((file_path, cache_key) + results[file_path])
+        
+        pending = []  # (file_path, cache_key, duration, fingerprint)
+        for file_path, cache_key, duration, fingerprint in fingerprinted:
+            local_metadata = self._local_fingerprint_match(duration, fingerprint)
+            if local_metadata:
+                self._cache_put(self.fingerprint_cache, cache_key, local_metadata)
+                found[file_path] = local_metadata
+            else:
+                pending.append((file_path, cache_key, duration, fingerprint))
+        
+        for start in range(0, len(pending), ACOUSTID_BATCH_SIZE):
+            if self.cancelled.is_set():
+                break
+            found.update(self._acoustid_lookup_batch(pending[start:start + ACOUSTID_BATCH_SIZE]))
+        
+        return found
+    
+    def _acoustid_lookup_batch(self, batch: List[Tuple[Path, int, float, str]]) -> Dict[Path, Optional[Dict[str, str]]]:
+        """Look up (file_path, cache_key, duration, fingerprint) entries in a single AcoustID request."""
+        logger.info("  [FINGERPRINT_BATCH] Looking up %s fingerprints in one AcoustID request", len(batch))
+        data = {}
+        for index, (_, _, duration, fingerprint) in enumerate(batch):
+            data[f'duration.{index}'] = str(int(duration))
+            data[f'fingerprint.{index}'] = fingerprint
+        
+        try:
+            payload = self._acoustid_lookup(data)
+        except Exception as e:
+            logger.warning("  [FINGERPRINT_BATCH] AcoustID batch lookup failed: %s", e)
+            return {}
+        
+        results_by_index = {
+            int(entry.get('index', -1)): entry.get('results', [])
+            for entry in payload.get('fingerprints', [])
+        }
+        found = {}
+        for index, (file_path, cache_key, duration, fingerprint) in enumerate(batch):
+            metadata = self._parse_acoustid_results(results_by_index.get(index, []), duration)
+            if metadata:
+                self._remember_fingerprint(duration, fingerprint, metadata)
+            self._cache_put(self.fingerprint_cache, cache_key, metadata)
+            found[file_path] = metadata
+        
+        return found
+    
+    def audio_fingerprint_lookup(self, file_path: Path,
+                                 file_stat: Optional[os.stat_result] = None) -> Optional[Dict[str, str]]:
         """Use audio fingerprinting to identify unknown tracks."""
         if not self.fingerprint_enabled:
             return None
         
-        cache_key = f"fingerprint_{file_path.name}_{file_path.stat().st_size}"
-        if cache_key in self.fingerprint_cache:
-            return self.fingerprint_cache[cache_key]
+        cache_key = self._fingerprint_cache_key(file_path, file_stat)
+        cached = self._cache_get(self.fingerprint_cache, cache_key)
+        if cached is not _CACHE_MISS:
+            return cached
         
         try:
-            logger.info(f"  [FINGERPRINT] Analyzing audio fingerprint for: {file_path.name}")
+            logger.debug("  [FINGERPRINT] Analyzing audio fingerprint for: %s", file_path.name)
             
             # Check if fpcalc is available
-            try:
-                import subprocess
-                result = subprocess.run(['fpcalc', '--version'], capture_output=True, text=True, timeout=5)
-                # fpcalc returns error code 1 for --version but that's normal, just check if it runs
-            except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.CalledProcessError):
-                try:
-                    # Try without --version
-                    result = subprocess.run(['fpcalc'], capture_output=True, text=True, timeout=5)
-                    if 'No input files' not in result.stderr:
-                        logger.warning(f"  [FINGERPRINT] fpcalc not found or not working properly")
-                        self.fingerprint_enabled = False
-                        self.fingerprint_cache[cache_key] = None
-                        return None
-                except Exception as e:
-                    logger.warning(f"  [FINGERPRINT] fpcalc not available: {e}")
-                    self.fingerprint_enabled = False
-                    self.fingerprint_cache[cache_key] = None
-                    return None
+            if not self._fpcalc_available():
+                self.fingerprint_cache[cache_key] = None
+                return None
             
             # Generate audio fingerprint
             try:
-                duration, fingerprint = acoustid.fingerprint_file(str(file_path))
+                duration, fingerprint = self._fingerprint_file(file_path, cache_key)
             except Exception as e:
                 if "fpcalc" in str(e).lower():
-                    logger.warning(f"  [FINGERPRINT] fpcalc not found in PATH. Please ensure Chromaprint is installed.")
-                    logger.info(f"  [FINGERPRINT] Install guide: https://acoustid.org/chromaprint")
+                    logger.warning("  [FINGERPRINT] fpcalc not found in PATH. Please ensure Chromaprint is installed.")
+                    logger.info("  [FINGERPRINT] Install guide: https://acoustid.org/chromaprint")
                     self.fingerprint_enabled = False
                 else:
-                    logger.warning(f"  [FINGERPRINT] Fingerprinting failed: {e}")
+                    logger.warning("  [FINGERPRINT] Fingerprinting failed: %s", e)
                 self.fingerprint_cache[cache_key] = None
                 return None
             
             if not fingerprint:
-                logger.warning(f"  [FINGERPRINT] Could not generate fingerprint")
-                self.fingerprint_cache[cache_key] = None
+                logger.warning("  [FINGERPRINT] Could not generate fingerprint")
+                self._cache_put(self.fingerprint_cache, cache_key, None)
                 return None
             
-            logger.info(f"  [FINGERPRINT] Generated fingerprint (duration: {duration}s)")
+            logger.debug("  [FINGERPRINT] Generated fingerprint (duration: %ss)", duration)
+            
+            # A recording identified earlier (this run or a previous one) needs no AcoustID request
+            local_metadata = self._local_fingerprint_match(duration, fingerprint)
+            if local_metadata:
+                self._cache_put(self.fingerprint_cache, cache_key, local_metadata)
+                return local_metadata
             
             # Lookup in AcoustID database
             try:
-                results = acoustid.lookup(ACOUSTID_API_KEY, fingerprint, duration, 
-                                        meta='recordings releasegroups releases artists')
+                results = self._acoustid_lookup({
+                    'duration': str(int(duration)),
+                    'fingerprint': fingerprint,
+                })
                 
-                if results.get('status') == 'ok' and results.get('results'):
-                    for result in results['results']:
-                        if result.get('score', 0) > 0.8:  # High confidence threshold
-                            recordings = result.get('recordings', [])
-                            
-                            if recordings:
-                                recording = recordings[0]  # Take best match
-                                
-                                metadata = {
-                                    'title': recording.get('title', ''),
-                                    'musicbrainz_recordingid': recording.get('id', ''),
-                                    'duration': str(duration),
-                                    'acoustid_score': str(result.get('score', 0))
-                                }
-                                
-                                # Get artist info
-                                if 'artists' in recording:
-                                    artists = recording['artists']
-                                    if artists:
-                                        metadata['artist'] = artists[0].get('name', '')
-                                        metadata['musicbrainz_artistid'] = artists[0].get('id', '')
-                                
-                                # Get release info
-                                if 'releases' in recording:
-                                    releases = recording['releases']
-                                    if releases:
-                                        release = releases[0]
-                                        metadata['album'] = release.get('title', '')
-                                        metadata['musicbrainz_albumid'] = release.get('id', '')
-                                        metadata['date'] = release.get('date', '')
-                                        
-                                        # Get track number from medium
-                                        if 'mediums' in release:
-                                            for medium in release['mediums']:
-                                                if 'tracks' in medium:
-                                                    for track in medium['tracks']:
-                                                        if track.get('id') == recording.get('id'):
-                                                            metadata['track_number'] = track.get('position', '')
-                                                            break
-                                
-                                logger.info(f"  [FINGERPRINT_SUCCESS] Identified: {metadata.get('artist', '')} - {metadata.get('title', '')} (Score: {result.get('score', 0):.2f})")
-                                self.fingerprint_cache[cache_key] = metadata
-                                return metadata
-                
-                logger.info(f"  [FINGERPRINT] No high-confidence matches found")
-                self.fingerprint_cache[cache_key] = None
-                return None
+                metadata = self._parse_acoustid_results(results.get('results', []), duration)
+                if metadata:
+                    self._remember_fingerprint(duration, fingerprint, metadata)
+                else:
+                    logger.info("  [FINGERPRINT] No high-confidence matches found")
+                self._cache_put(self.fingerprint_cache, cache_key, metadata)
+                return metadata
                 
             except Exception as e:
-                logger.warning(f"  [FINGERPRINT] AcoustID lookup failed: {e}")
+                logger.warning("  [FINGERPRINT] AcoustID lookup failed: %s", e)
                 self.fingerprint_cache[cache_key] = None
                 return None
                 
         except Exception as e:
-            logger.warning(f"  [FINGERPRINT] Fingerprinting failed: {e}")
+            logger.warning("  [FINGERPRINT] Fingerprinting failed: %s", e)
             self.fingerprint_cache[cache_key] = None
             return None
     
     def _is_generic_filename(self, filename: str) -> bool:
         """Check if filename appears to be generic (Track 01, etc.)."""
-        filename_lower = filename.lower().strip()
-        
-        # More comprehensive generic patterns
-        generic_patterns = [
-            r'^track\s*\d+',                       # "Track 01", "Track01", "track 5"
-            r'^\d+[\s\-_\.]*track\d*',             # "01 Track", "01-Track", "05. Track05"
-            r'^\d+[\s\-_\.]*$',                    # "01", "02", "05."
-            r'^\d+[\s\-_\.]+\d+$',                 # "01 01", "05. 05"
-            r'^track[\s\-_\.]*\d+',                # "Track.01", "Track-05"
-            r'^\d+[\s\-_\.]*(track|titulo|cancion|song)', # Multi-language
-            r'^(track|titulo|cancion|song)[\s\-_\.]*\d+',  # "Song 01", "Cancion 02"
-            r'untitled[\s\-_]*\d*',
-            r'^audio[\s\-_]*\d+',                  # "Audio 01"
-            r'^pista[\s\-_]*\d+',                  # Spanish: "Pista 01"
-        ]
-        
-        for pattern in generic_patterns:
-            if re.search(pattern, filename_lower):
-                logger.info(f"  [GENERIC_DETECTED] '{filename}' matches pattern: {pattern}")
-                return True
+        matched = _generic_match(filename)
+        if matched is not None:
+            logger.debug("  [GENERIC_DETECTED] '%s' matches generic pattern: '%s'", filename, matched)
+            return True
         
-        logger.info(f"  [NOT_GENERIC] '{filename}' does not match generic patterns")
+        logger.debug("  [NOT_GENERIC] '%s' does not match generic patterns", filename)
         return False
     
     def _extract_track_number(self, filename: str) -> Optional[int]:
         """Extract track number from filename."""
-        # Try different patterns
-        patterns = [
-            r'^(\d+)[\s\-_\.]*',  # Leading number
-            r'track[\s\-_]*(\d+)',  # "Track NN"
-            r'(\d+)[\s\-_]*track',  # "NN Track"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, filename.lower())
-            if match:
-                try:
-                    return int(match.group(1))
-                except ValueError:
-                    continue
-        return None
+        return _track_number_from_filename(filename)
     
-    def parse_directory_structure(self, file_path: Path, source_path: Path) -> Dict[str, str]:
+    def parse_directory_structure(self, file_path: Path, source_path: Path,
+                                  relative_parts: Optional[Tuple[str, ...]] = None) -> Dict[str, str]:
         """
         Parse directory structure to extract artist, album, and track info.
         
@@ -370,10 +1199,14 @@ class AdvancedMetadataLookup:
         - Artist - Album/Track.wav
         - Artist/Year - Album/Track.wav
         - Various/Artists - Compilation/Track.wav
+        
+        relative_parts can be passed in from the directory walk to avoid
+        recomputing the path relative to source_path.
         """
-        relative_path = file_path.relative_to(source_path)
-        parts = relative_path.parts[:-1]  # Exclude filename
-        filename = relative_path.stem
+        if relative_parts is None:
+            relative_parts = file_path.relative_to(source_path).parts
+        parts = relative_parts[:-1]  # Exclude filename
+        filename = os.path.splitext(relative_parts[-1])[0]
         
         metadata = {
             'title': filename,
@@ -392,31 +1225,37 @@ class AdvancedMetadataLookup:
             # For generic filenames, clean up the title
             if metadata['is_generic']:
                 # Remove track number and common prefixes
-                clean_title = re.sub(r'^(\d+[\s\-_\.]*)|(track[\s\-_]*\d*[\s\-_]*)', '', filename, flags=re.IGNORECASE)
+                clean_title = _GENERIC_PREFIX_RE.sub('', filename)
                 metadata['title'] = clean_title.strip() if clean_title.strip() else filename
         
+        metadata['artist'], metadata['album'], metadata['year'] = self._parse_directory_parts(parts)
+        metadata['title'] = metadata['title'].strip()
+        
+        return metadata
+    
+    def _parse_directory_parts(self, parts: Tuple[str, ...]) -> Tuple[str, str, str]:
+        """Extract (artist, album, year) from a file's directory components, once per directory."""
+        cached = self._directory_cache.get(parts)
+        if cached is not None:
+            return cached
+        
+        artist = album = year = ''
+        
         if len(parts) >= 1:
             # Last directory is usually the album
             album_part = parts[-1]
             
             # Check for year in album name (various formats)
-            year_patterns = [
-                r'\b(19|20)\d{2}\b',  # Standard 4-digit year
-                r'\((\d{4})\)',  # Year in parentheses
-                r'\[(\d{4})\]',  # Year in brackets
-            ]
-            
-            for pattern in year_patterns:
-                year_match = re.search(pattern, album_part)
+            for pattern, year_in_group in _YEAR_RES:
+                year_match = pattern.search(album_part)
                 if year_match:
-                    metadata['year'] = year_match.group(1) if '(' in pattern or '[' in pattern else year_match.group(0)
+                    year = year_match.group(1) if year_in_group else year_match.group(0)
                     # Remove year from album name
-                    album_clean = re.sub(pattern, '', album_part).strip()
-                    album_clean = re.sub(r'\s*[-_\(\)\[\]]\s*', ' ', album_clean).strip()
-                    metadata['album'] = album_clean
+                    album_clean = pattern.sub('', album_part).strip()
+                    album = _ALBUM_CLEAN_RE.sub(' ', album_clean).strip()
                     break
             else:
-                metadata['album'] = album_part
+                album = album_part
         
         if len(parts) >= 2:
             # Second to last is usually the artist
@@ -424,16 +1263,13 @@ class AdvancedMetadataLookup:
             
             # Handle various artist compilations
             if artist_part.lower() in ['various artists', 'various', 'compilation', 'va']:
-                metadata['artist'] = 'Various Artists'
+                artist = 'Various Artists'
             else:
-                metadata['artist'] = artist_part
+                artist = artist_part
         
-        # Clean up metadata
-        for key in ['title', 'artist', 'album', 'year']:
-            if isinstance(metadata[key], str):
-                metadata[key] = metadata[key].strip()
-        
-        return metadata
+        result = (artist.strip(), album.strip(), year.strip())
+        self._directory_cache[parts] = result
+        return result
     
     def search_album_tracks(self, artist: str, album: str) -> Optional[List[Dict[str, str]]]:
         """
@@ -443,13 +1279,29 @@ class AdvancedMetadataLookup:
         if not all([artist, album]):
             return None
         
-        cache_key = f"album_{artist}|{album}".lower()
-        if cache_key in self.album_cache:
-            return self.album_cache[cache_key]
+        cache_key = _cache_key('album', artist, album)
+        cached = self._cache_get(self.album_cache, cache_key)
+        if cached is not _CACHE_MISS:
+            return cached
+        
+        # Sibling tracks are processed concurrently; only one of them should
+        # query MusicBrainz while the others wait for the cached tracklist.
+        # Fetches for different albums do not wait on each other.
+        with self._album_locks_lock:
+            album_lock = self._album_locks.setdefault(cache_key, threading.Lock())
+        with album_lock:
+            return self._search_album_tracks(artist, album, cache_key)
+    
+    def _search_album_tracks(self, artist: str, album: str, cache_key: int) -> Optional[List[Dict[str, str]]]:
+        """Implementation of search_album_tracks; the caller must hold the album's lock."""
+        # Another thread may have fetched the album while this one waited
+        cached = self._cache_get(self.album_cache, cache_key)
+        if cached is not _CACHE_MISS:
+            return cached
         
         try:
-            self._rate_limit()
-            logger.info(f"  [ALBUM_SEARCH] Searching for album: {artist} - {album}")
+            self._mb_limiter.acquire()
+            logger.debug("  [ALBUM_SEARCH] Searching for album: %s - %s", artist, album)
             
             # Search for releases
             query = f'artist:"{artist}" AND release:"{album}"'
@@ -462,6 +1314,7 @@ class AdvancedMetadataLookup:
             
             if not result.get('release-list'):
                 # Try with partial matching
+                self._mb_limiter.acquire()
                 query = f'artist:{artist} AND release:{album}'
                 result = musicbrainzngs.search_releases(
                     query=query,
@@ -473,15 +1326,17 @@ class AdvancedMetadataLookup:
                 # Find best matching release
                 best_release = None
                 best_score = 0
+                album_lower = album.lower()
+                artist_lower = artist.lower()
                 
                 for release in result['release-list']:
                     # Calculate similarity score
-                    album_score = SequenceMatcher(None, album.lower(), release.get('title', '').lower()).ratio()
+                    album_score = _ratio(album_lower, release.get('title', '').lower())
                     artist_score = 0
                     
                     if 'artist-credit' in release:
                         release_artist = release['artist-credit'][0].get('name', '')
-                        artist_score = SequenceMatcher(None, artist.lower(), release_artist.lower()).ratio()
+                        artist_score = _ratio(artist_lower, release_artist.lower())
                     
                     total_score = (album_score + artist_score) / 2
                     
@@ -493,7 +1348,7 @@ class AdvancedMetadataLookup:
                     release_id = best_release['id']
                     
                     # Get detailed release info with tracks
-                    self._rate_limit()
+                    self._mb_limiter.acquire()
                     detailed_release = musicbrainzngs.get_release_by_id(
                         release_id,
                         includes=['recordings', 'artist-credits', 'media']
@@ -522,39 +1377,70 @@ class AdvancedMetadataLookup:
                                         
                                         tracks.append(track_info)
                         
-                        self.album_cache[cache_key] = tracks
-                        logger.info(f"  [ALBUM_FOUND] Found {len(tracks)} tracks for album: {album}")
+                        self._cache_put(self.album_cache, cache_key, tracks)
+                        logger.info("  [ALBUM_FOUND] Found %s tracks for album: %s", len(tracks), album)
                         return tracks
             
-            logger.info(f"  [ALBUM_NOT_FOUND] No suitable album found for: {artist} - {album}")
-            self.album_cache[cache_key] = None
+            logger.info("  [ALBUM_NOT_FOUND] No suitable album found for: %s - %s", artist, album)
+            self._cache_put(self.album_cache, cache_key, None)
             return None
             
         except Exception as e:
-            logger.warning(f"  [ALBUM_ERROR] Error searching for album {artist} - {album}: {str(e)}")
+            logger.warning("  [ALBUM_ERROR] Error searching for album %s - %s: %s", artist, album, e)
             self.album_cache[cache_key] = None
             return None
     
+    def prefetch_album(self, artist: str, album: str) -> bool:
+        """
+        Fetch an album's full tracklist once and seed the per-track cache from it.
+        
+        Individual track searches for files of this album then become cache hits
+        instead of separate rate-limited MusicBrainz queries.
+        """
+        tracks = self.search_album_tracks(artist, album)
+        if not tracks:
+            return False
+        
+        seeded = 0
+        for track in tracks:
+            if not track.get('title'):
+                continue
+            cache_key = _cache_key('track', artist, album, track['title'])
+            if cache_key not in self.cache:
+                self.cache[cache_key] = dict(track)
+                seeded += 1
+        
+        logger.info("  [ALBUM_PREFETCH] Seeded %s track lookups for: %s - %s", seeded, artist, album)
+        return True
+    
     def search_track_by_position(self, artist: str, album: str, track_number: int) -> Optional[Dict[str, str]]:
         """Find track metadata by position in album."""
         tracks = self.search_album_tracks(artist, album)
         if not tracks:
             return None
         
-        # Find track by position
-        for track in tracks:
-            try:
-                if int(track.get('position', 0)) == track_number:
-                    logger.info(f"  [POSITION_MATCH] Found track {track_number}: {track.get('title')}")
-                    return track
-            except ValueError:
-                continue
+        # Find track by position (indexed once per album, shared by its sibling tracks)
+        index_key = _cache_key('album', artist, album)
+        positions = self._position_index.get(index_key)
+        if positions is None:
+            positions = {}
+            for track in tracks:
+                try:
+                    positions.setdefault(int(track.get('position', 0)), track)
+                except (TypeError, ValueError):
+                    continue
+            self._position_index[index_key] = positions
+        
+        track = positions.get(track_number)
+        if track is not None:
+            logger.info("  [POSITION_MATCH] Found track %s: %s", track_number, track.get('title'))
+            return track
         
         # If exact position not found, try by index (some albums start from 0)
         try:
             if 0 <= track_number - 1 < len(tracks):
                 track = tracks[track_number - 1]
-                logger.info(f"  [INDEX_MATCH] Found track by index {track_number}: {track.get('title')}")
+                logger.info("  [INDEX_MATCH] Found track by index %s: %s", track_number, track.get('title'))
                 return track
         except IndexError:
             pass
@@ -564,91 +1450,115 @@ class AdvancedMetadataLookup:
     def search_musicbrainz_individual(self, artist: str, album: str, title: str) -> Optional[Dict[str, str]]:
         """
         Search MusicBrainz for individual track metadata.
-        Enhanced with multiple search strategies.
+        
+        Uses the parent album's tracklist when it has already been fetched,
+        otherwise issues a single loose recording query and rescores the
+        candidates locally.
         """
         if not all([artist, title]):
             return None
         
-        cache_key = f"track_{artist}|{album}|{title}".lower()
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+        cache_key = _cache_key('track', artist, album, title)
+        cached = self._cache_get(self.cache, cache_key)
+        if cached is not _CACHE_MISS:
+            return cached
+        
+        # The album tracklist is already known - no need for a separate search
+        album_match = self._match_album_track(artist, album, title)
+        if album_match:
+            self.cache[cache_key] = album_match
+            return album_match
         
         try:
-            self._rate_limit()
-            logger.info(f"  [TRACK_SEARCH] Searching MusicBrainz for: {artist} - {title}")
+            self._mb_limiter.acquire()
+            logger.debug("  [TRACK_SEARCH] Searching MusicBrainz for: %s - %s", artist, title)
             
-            # Multiple search strategies
-            search_strategies = [
-                # Exact match with quotes
-                f'artist:"{artist}" AND recording:"{title}"' + (f' AND release:"{album}"' if album else ''),
-                # Partial match without quotes
-                f'artist:{artist} AND recording:{title}' + (f' AND release:{album}' if album else ''),
-                # Fuzzy search with just artist and title
-                f'artist:{artist} AND recording:{title}',
-                # Very loose search
-                f'{artist} {title}'
-            ]
+            # One query where exact phrases are boosted but loose term matches still
+            # qualify, and the album only influences ranking
+            query = (
+                f'(recording:"{_lucene_escape(title)}"^2 OR recording:({_lucene_escape(title)})) '
+                f'AND (artist:"{_lucene_escape(artist)}"^2 OR artist:({_lucene_escape(artist)}))'
+            )
+            if album:
+                query += f' release:({_lucene_escape(album)})'
             
-            for i, query in enumerate(search_strategies):
-                try:
-                    result = musicbrainzngs.search_recordings(
-                        query=query,
-                        limit=10,
-                        strict=False
-                    )
-                    
-                    if result.get('recording-list'):
-                        # Find best match
-                        best_recording = None
-                        best_score = 0
-                        
-                        for recording in result['recording-list']:
-                            # Calculate similarity scores
-                            title_score = SequenceMatcher(None, title.lower(), recording.get('title', '').lower()).ratio()
-                            
-                            artist_score = 0
-                            if 'artist-credit' in recording:
-                                rec_artist = recording['artist-credit'][0].get('name', '')
-                                artist_score = SequenceMatcher(None, artist.lower(), rec_artist.lower()).ratio()
-                            
-                            album_score = 0
-                            if album and 'release-list' in recording:
-                                for release in recording['release-list']:
-                                    rel_title = release.get('title', '')
-                                    score = SequenceMatcher(None, album.lower(), rel_title.lower()).ratio()
-                                    album_score = max(album_score, score)
-                            
-                            # Weighted average
-                            total_score = (title_score * 0.5 + artist_score * 0.3 + album_score * 0.2)
-                            
-                            if total_score > best_score:
-                                best_score = total_score
-                                best_recording = recording
-                        
-                        # Use result if similarity is high enough
-                        min_threshold = 0.8 if i == 0 else 0.6  # Higher threshold for exact searches
-                        if best_recording and best_score >= min_threshold:
-                            metadata = self._extract_recording_metadata(best_recording, artist, album, title)
-                            self.cache[cache_key] = metadata
-                            logger.info(f"  [TRACK_FOUND] Found with strategy {i+1}, score: {best_score:.2f}")
-                            return metadata
-                    
-                    if i < len(search_strategies) - 1:
-                        self._rate_limit()
-                        
-                except Exception as e:
-                    logger.warning(f"  [SEARCH_ERROR] Strategy {i+1} failed: {str(e)}")
-                    continue
+            result = musicbrainzngs.search_recordings(
+                query=query,
+                limit=25,
+                strict=False
+            )
             
-            logger.info(f"  [TRACK_NOT_FOUND] No suitable match found for: {artist} - {title}")
-            self.cache[cache_key] = None
+            # Find best match
+            best_recording = None
+            best_score = 0
+            title_lower = title.lower()
+            artist_lower = artist.lower()
+            album_lower = album.lower()
+            
+            for recording in result.get('recording-list', []):
+                # Calculate similarity scores
+                title_score = _ratio(title_lower, recording.get('title', '').lower())
+                
+                artist_score = 0
+                if 'artist-credit' in recording:
+                    rec_artist = recording['artist-credit'][0].get('name', '')
+                    artist_score = _ratio(artist_lower, rec_artist.lower())
+                
+                album_score = 0
+                if album and 'release-list' in recording:
+                    for release in recording['release-list']:
+                        rel_title = release.get('title', '')
+                        score = _ratio(album_lower, rel_title.lower())
+                        album_score = max(album_score, score)
+                
+                # Weighted average
+                total_score = (title_score * 0.5 + artist_score * 0.3 + album_score * 0.2)
+                
+                if total_score > best_score:
+                    best_score = total_score
+                    best_recording = recording
+            
+            # Use result if similarity is high enough
+            if best_recording and best_score >= 0.6:
+                metadata = self._extract_recording_metadata(best_recording, artist, album, title)
+                self._cache_put(self.cache, cache_key, metadata)
+                logger.info("  [TRACK_FOUND] Found match, score: %.2f", best_score)
+                return metadata
+            
+            logger.info("  [TRACK_NOT_FOUND] No suitable match found for: %s - %s", artist, title)
+            self._cache_put(self.cache, cache_key, None)
             return None
             
         except Exception as e:
-            logger.warning(f"  [TRACK_ERROR] Error searching for track {artist} - {title}: {str(e)}")
+            logger.warning("  [TRACK_ERROR] Error searching for track %s - %s: %s", artist, title, e)
             self.cache[cache_key] = None
             return None
     
+    def _match_album_track(self, artist: str, album: str, title: str) -> Optional[Dict[str, str]]:
+        """Match a title against an already-fetched album tracklist without any network call."""
+        if not album:
+            return None
+        
+        tracks = self._cache_get(self.album_cache, _cache_key('album', artist, album))
+        if not tracks or tracks is _CACHE_MISS:
+            return None
+        
+        # Filenames often carry a leading track number ("01 Song Name")
+        clean_title = _LEADING_NUMBER_RE.sub('', title).strip().lower() or title.lower()
+        
+        best_track = None
+        best_score = 0
+        for track in tracks:
+            score = _ratio(clean_title, track.get('title', '').lower())
+            if score > best_score:
+                best_score = score
+                best_track = track
+        
+        if best_track and best_score >= 0.8:
+            logger.info("  [ALBUM_TRACK_MATCH] Matched '%s' to '%s' from album tracklist", title, best_track.get('title'))
+            return dict(best_track)
+        return None
+    
     def _extract_recording_metadata(self, recording: Dict, fallback_artist: str, fallback_album: str, fallback_title: str) -> Dict[str, str]:
         """Extract metadata from MusicBrainz recording object."""
         metadata = {
@@ -678,7 +1588,8 @@ class AdvancedMetadataLookup:
     
     def get_metadata(self, artist: str, album: str, title: str, track_number: Optional[int] = None, 
                     is_generic: bool = False, file_path: Optional[Path] = None, 
-                    existing_metadata: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+                    existing_metadata: Optional[Dict[str, str]] = None,
+                    file_stat: Optional[os.stat_result] = None) -> Dict[str, str]:
         """
         Main method to get metadata using intelligent fallback strategies.
         
@@ -696,75 +1607,82 @@ class AdvancedMetadataLookup:
         4. Try Last.fm with known title
         5. Fall back to directory structure metadata
         """
-        logger.info(f"[METADATA] Processing: {artist} - {album} - {title} (Track: {track_number}, Generic: {is_generic})")
+        logger.info("[METADATA] Processing: %s - %s - %s (Track: %s, Generic: %s)", artist, album, title, track_number, is_generic)
         
         # Strategy 1: Check if existing metadata is already complete
         if existing_metadata and self._is_metadata_complete(existing_metadata):
-            logger.info(f"  [EXISTING] Metadata is complete, skipping lookup")
+            logger.info("  [EXISTING] Metadata is complete, skipping lookup")
+            return existing_metadata
+        
+        # An existing MusicBrainz recording ID already identifies the track;
+        # fingerprinting or searching again would only rediscover it
+        if (existing_metadata and existing_metadata.get('musicbrainz_recordingid') and
+                existing_metadata.get('title') and existing_metadata.get('artist')):
+            logger.info("  [EXISTING] Track already identified by MusicBrainz ID, skipping lookup")
             return existing_metadata
         
         # Strategy 2: For GENERIC files - Audio fingerprinting FIRST (pure audio search)
         if is_generic and file_path and self.fingerprint_enabled:
-            logger.info(f"  [STRATEGY] GENERIC FILE: Attempting pure audio fingerprinting for complete metadata")
-            fingerprint_metadata = self.audio_fingerprint_lookup(file_path)
+            logger.debug("  [STRATEGY] GENERIC FILE: Attempting pure audio fingerprinting for complete metadata")
+            fingerprint_metadata = self.audio_fingerprint_lookup(file_path, file_stat)
             if fingerprint_metadata:
-                logger.info(f"  [FINGERPRINT_SUCCESS] Found complete metadata via audio: {fingerprint_metadata.get('artist', '')} - {fingerprint_metadata.get('title', '')}")
+                logger.info("  [FINGERPRINT_SUCCESS] Found complete metadata via audio: %s - %s", fingerprint_metadata.get('artist', ''), fingerprint_metadata.get('title', ''))
                 
                 # Add track number from directory if missing
                 if track_number and not fingerprint_metadata.get('track_number'):
                     fingerprint_metadata['track_number'] = str(track_number).zfill(2)
                 
                 # Audio fingerprint provides complete, accurate metadata - no need for additional searches!
-                logger.info(f"  [COMPLETE] Using pure audio fingerprint metadata (no external searches needed)")
+                logger.info("  [COMPLETE] Using pure audio fingerprint metadata (no external searches needed)")
                 return fingerprint_metadata
             else:
-                logger.info(f"  [FINGERPRINT_FAILED] No audio fingerprint match found")
+                logger.info("  [FINGERPRINT_FAILED] No audio fingerprint match found")
         
         # Strategy 3: For GENERIC files - Album-based lookup (backup for when fingerprinting fails)
         if is_generic and track_number and artist and album:
-            logger.info(f"  [STRATEGY] GENERIC FILE: Attempting album-based lookup as backup")
+            logger.debug("  [STRATEGY] GENERIC FILE: Attempting album-based lookup as backup")
             album_metadata = self.search_track_by_position(artist, album, track_number)
             if album_metadata:
-                logger.info(f"  [ALBUM_SUCCESS] Found metadata: {album_metadata.get('title', 'Unknown')}")
+                logger.info("  [ALBUM_SUCCESS] Found metadata: %s", album_metadata.get('title', 'Unknown'))
                 return album_metadata
             else:
-                logger.info(f"  [ALBUM_FAILED] No track found at position {track_number}")
+                logger.info("  [ALBUM_FAILED] No track found at position %s", track_number)
         
         # Strategy 4: For NON-GENERIC files - Individual track search
         if not is_generic:
-            logger.info(f"  [STRATEGY] NON-GENERIC FILE: Attempting individual track search")
+            logger.debug("  [STRATEGY] NON-GENERIC FILE: Attempting individual track search")
             track_metadata = self.search_musicbrainz_individual(artist, album, title)
             if track_metadata:
-                logger.info(f"  [TRACK_SUCCESS] Found individual track metadata")
+                logger.info("  [TRACK_SUCCESS] Found individual track metadata")
                 return track_metadata
             
             # Try audio fingerprinting for non-generic files too
             if file_path and self.fingerprint_enabled:
-                logger.info(f"  [STRATEGY] NON-GENERIC FILE: Attempting audio fingerprinting")
-                fingerprint_metadata = self.audio_fingerprint_lookup(file_path)
+                logger.debug("  [STRATEGY] NON-GENERIC FILE: Attempting audio fingerprinting")
+                fingerprint_metadata = self.audio_fingerprint_lookup(file_path, file_stat)
                 if fingerprint_metadata:
-                    logger.info(f"  [FINGERPRINT_SUCCESS] Found metadata via audio fingerprinting")
+                    logger.info("  [FINGERPRINT_SUCCESS] Found metadata via audio fingerprinting")
                     if track_number and not fingerprint_metadata.get('track_number'):
                         fingerprint_metadata['track_number'] = str(track_number).zfill(2)
                     return fingerprint_metadata
             
             # Try Last.fm with the known (non-generic) title
             if self.lastfm_enabled:
-                logger.info(f"  [STRATEGY] NON-GENERIC FILE: Attempting Last.fm search with known title")
+                logger.debug("  [STRATEGY] NON-GENERIC FILE: Attempting Last.fm search with known title")
                 lastfm_metadata = self.lastfm_search(artist, title, album)
                 if lastfm_metadata:
-                    logger.info(f"  [LASTFM_SUCCESS] Found metadata via Last.fm search")
+                    logger.info("  [LASTFM_SUCCESS] Found metadata via Last.fm search")
                     if track_number and not lastfm_metadata.get('track_number'):
                         lastfm_metadata['track_number'] = str(track_number).zfill(2)
                     return lastfm_metadata
         
         # Strategy 5: For GENERIC files - DO NOT search Last.fm with generic names
         if is_generic:
-            logger.info(f"  [STRATEGY] GENERIC FILE: Skipping Last.fm search with generic filename '{title}'")
-            logger.info(f"  [REASON] Searching Last.fm for 'Track01' etc. produces unreliable results")
+            logger.debug("  [STRATEGY] GENERIC FILE: Skipping Last.fm search with generic filename '%s'", title)
+            logger.debug("  [REASON] Searching Last.fm for 'Track01' etc. produces unreliable results")
         
         # Strategy 6: Fallback to directory structure
-        logger.info(f"  [STRATEGY] Using directory structure metadata as fallback")
+        logger.debug("  [STRATEGY] Using directory structure metadata as fallback")
         fallback_metadata = {
             'title': title,
             'artist': artist,
@@ -772,144 +1690,146 @@ class AdvancedMetadataLookup:
             'track_number': str(track_number).zfill(2) if track_number else '',
         }
         
-        # Merge with any existing metadata
+        # Merge with any existing metadata (non-empty directory values take precedence)
         if existing_metadata:
-            for key, value in existing_metadata.items():
-                if value and not fallback_metadata.get(key):
-                    fallback_metadata[key] = value
+            fallback_metadata = {
+                **{key: value for key, value in existing_metadata.items() if value},
+                **{key: value for key, value in fallback_metadata.items() if value},
+            }
         
-        logger.info(f"  [FALLBACK] Using metadata: title={fallback_metadata.get('title')}, artist={fallback_metadata.get('artist')}, album={fallback_metadata.get('album')}")
+        logger.info("  [FALLBACK] Using metadata: title=%s, artist=%s, album=%s", fallback_metadata.get('title'), fallback_metadata.get('artist'), fallback_metadata.get('album'))
         return fallback_metadata
     
+    def _lastfm_request(self, method: str, **params) -> Dict:
+        """GET a Last.fm web service method over the pooled session, within the shared Last.fm rate limit."""
+        params.update(method=method, api_key=LASTFM_API_KEY, format='json')
+        
+        self._lastfm_limiter.acquire()
+        response = _HTTP_SESSION.get(LASTFM_API_URL, params=params, timeout=30)
+        try:
+            payload = response.json()
+        except ValueError:
+            response.raise_for_status()
+            raise
+        
+        # Service errors come back as a JSON body, usually with a 4xx status
+        if 'error' in payload:
+            if payload['error'] == LASTFM_ERROR_RATE_LIMIT:
+                logger.warning("  [LASTFM] Rate limit exceeded, backing off for %ss", LASTFM_RATE_LIMIT_BACKOFF)
+                self._lastfm_limiter.penalize(LASTFM_RATE_LIMIT_BACKOFF)
+            raise LastFMError(payload['error'], payload.get('message', 'unknown error'))
+        response.raise_for_status()
+        return payload
+    
     def lastfm_search(self, artist: str, title: str, album: str = "") -> Optional[Dict[str, str]]:
         """Search Last.fm for track metadata using text-based search."""
         if not self.lastfm_enabled or not all([artist, title]):
             return None
         
-        cache_key = f"lastfm_{artist}|{title}|{album}".lower()
-        if cache_key in self.lastfm_cache:
-            return self.lastfm_cache[cache_key]
+        cache_key = _cache_key('lastfm', artist, title, album)
+        cached = self._cache_get(self.lastfm_cache, cache_key)
+        if cached is not _CACHE_MISS:
+            return cached
+        
+        title_lower = title.lower()
+        artist_lower = artist.lower()
+        transient = False  # A failed request is retried next run rather than cached as "not found"
         
         try:
-            logger.info(f"  [LASTFM] Searching Last.fm for: {artist} - {title}")
-            
-            # Add rate limiting for Last.fm API
-            time.sleep(0.3)  # Small delay to respect API limits
+            logger.debug("  [LASTFM] Searching Last.fm for: %s - %s", artist, title)
             
-            # Search for track
+            # Search for track - one track.getInfo call returns the name, counts, album and tags
             try:
-                track = self.lastfm_network.get_track(artist, title)
+                track = self._lastfm_request('track.getInfo', artist=artist, track=title)['track']
+                track_artist = track.get('artist') or {}
                 
-                # Get track info - fix the method call
-                try:
-                    # Try to get track info first
-                    track_title = track.get_name()
-                    track_artist = track.get_artist().get_name() if track.get_artist() else artist
-                    track_url = track.get_url()
-                    
-                    metadata = {
-                        'title': track_title or title,
-                        'artist': track_artist or artist,
-                        'lastfm_url': track_url or '',
-                    }
-                    
-                    # Try to get additional info
-                    try:
-                        playcount = track.get_playcount()
-                        metadata['playcount'] = str(playcount) if playcount else '0'
-                    except:
-                        metadata['playcount'] = '0'
-                    
-                    try:
-                        listeners = track.get_listener_count()
-                        metadata['listeners'] = str(listeners) if listeners else '0'
-                    except:
-                        metadata['listeners'] = '0'
-                    
-                    # Get album info if available
-                    try:
-                        track_album = track.get_album()
-                        if track_album:
-                            album_title = track_album.get_name()
-                            if album_title:
-                                metadata['album'] = album_title
-                                metadata['lastfm_album_url'] = track_album.get_url() or ''
-                        elif album:
-                            metadata['album'] = album
-                    except:
-                        if album:
-                            metadata['album'] = album
-                    
-                    # Get tags/genres
-                    try:
-                        # Add small delay before tags request to avoid rate limiting
-                        time.sleep(0.2)
-                        tags = track.get_top_tags(limit=3)
-                        if tags:
-                            genre_list = [tag.item.get_name() for tag in tags]
-                            if genre_list:
-                                metadata['genre'] = ', '.join(genre_list)
-                                logger.info(f"  [LASTFM] Found genres: {metadata['genre']}")
-                    except pylast.WSError as e:
-                        if "400" in str(e):
-                            logger.info(f"  [LASTFM] No tags available for this track")
-                        else:
-                            logger.warning(f"  [LASTFM] Tags lookup failed: {e}")
-                    except Exception as e:
-                        logger.warning(f"  [LASTFM] Tags lookup error: {e}")
-                    
-                    # Calculate confidence score based on match quality
-                    title_similarity = SequenceMatcher(None, title.lower(), metadata['title'].lower()).ratio()
-                    artist_similarity = SequenceMatcher(None, artist.lower(), metadata['artist'].lower()).ratio()
-                    confidence = (title_similarity + artist_similarity) / 2
-                    metadata['lastfm_confidence'] = str(confidence)
-                    
-                    if confidence > 0.8:
-                        logger.info(f"  [LASTFM_SUCCESS] Found: {metadata['artist']} - {metadata['title']} (Confidence: {confidence:.2f})")
-                        self.lastfm_cache[cache_key] = metadata
-                        return metadata
+                metadata = {
+                    'title': track.get('name') or title,
+                    'artist': track_artist.get('name') or artist,
+                    'lastfm_url': track.get('url') or '',
+                    'playcount': track.get('playcount') or '0',
+                    'listeners': track.get('listeners') or '0',
+                }
+                
+                track_album = track.get('album')
+                if track_album and track_album.get('title'):
+                    metadata['album'] = track_album['title']
+                    metadata['lastfm_album_url'] = track_album.get('url') or ''
+                elif album:
+                    metadata['album'] = album
+                
+                # Calculate confidence score based on match quality
+                title_similarity = _ratio(title_lower, metadata['title'].lower())
+                artist_similarity = _ratio(artist_lower, metadata['artist'].lower())
+                confidence = (title_similarity + artist_similarity) / 2
+                metadata['lastfm_confidence'] = str(confidence)
+                
+                if confidence > 0.8:
+                    # Genres come from the tags already in the track.getInfo response
+                    toptags = track.get('toptags')
+                    tags = (toptags.get('tag') if isinstance(toptags, dict) else None) or []
+                    if isinstance(tags, dict):
+                        tags = [tags]
+                    genre_list = [tag['name'] for tag in tags[:3] if isinstance(tag, dict) and tag.get('name')]
+                    if genre_list:
+                        metadata['genre'] = ', '.join(genre_list)
+                        logger.info("  [LASTFM] Found genres: %s", metadata['genre'])
                     else:
-                        logger.info(f"  [LASTFM] Low confidence match (Score: {confidence:.2f})")
-                        
-                except Exception as e:
-                    logger.warning(f"  [LASTFM] Error getting track details: {e}")
+                        logger.info("  [LASTFM] No tags available for this track")
+                    
+                    logger.info("  [LASTFM_SUCCESS] Found: %s - %s (Confidence: %.2f)", metadata['artist'], metadata['title'], confidence)
+                    self._cache_put(self.lastfm_cache, cache_key, metadata)
+                    return metadata
+                else:
+                    logger.info("  [LASTFM] Low confidence match (Score: %.2f)", confidence)
                     
-            except pylast.WSError as e:
-                logger.info(f"  [LASTFM] Track not found: {artist} - {title} ({e})")
+            except LastFMError as e:
+                if e.code == LASTFM_ERROR_NOT_FOUND:
+                    logger.info("  [LASTFM] Track not found: %s - %s (%s)", artist, title, e)
+                else:
+                    logger.warning("  [LASTFM] Search error: %s", e)
+                    transient = True
             except Exception as e:
-                logger.warning(f"  [LASTFM] Search error: {e}")
+                logger.warning("  [LASTFM] Search error: %s", e)
+                transient = True
             
             # Try artist correction if direct search failed
             try:
-                artist_obj = self.lastfm_network.get_artist(artist)
-                corrected_artist = artist_obj.get_correction()
+                response = self._lastfm_request('artist.getCorrection', artist=artist)
+                corrections = response.get('corrections')
+                correction = corrections.get('correction') if isinstance(corrections, dict) else None
+                if isinstance(correction, list):
+                    correction = correction[0] if correction else None
+                corrected_artist = correction['artist'].get('name') if correction else None
                 if corrected_artist and corrected_artist != artist:
-                    logger.info(f"  [LASTFM] Trying corrected artist: {corrected_artist}")
-                    track = self.lastfm_network.get_track(corrected_artist, title)
-                    
-                    track_title = track.get_name()
-                    track_artist = track.get_artist().get_name() if track.get_artist() else corrected_artist
+                    logger.info("  [LASTFM] Trying corrected artist: %s", corrected_artist)
                     
                     metadata = {
-                        'title': track_title or title,
-                        'artist': track_artist or corrected_artist,
+                        'title': title,
+                        'artist': corrected_artist,
                         'album': album,
                         'lastfm_corrected': 'true'
                     }
                     
-                    logger.info(f"  [LASTFM_CORRECTION] Found with corrected artist: {corrected_artist}")
-                    self.lastfm_cache[cache_key] = metadata
+                    logger.info("  [LASTFM_CORRECTION] Found with corrected artist: %s", corrected_artist)
+                    self._cache_put(self.lastfm_cache, cache_key, metadata)
                     return metadata
                     
+            except LastFMError as e:
+                if e.code != LASTFM_ERROR_NOT_FOUND:
+                    transient = True
             except Exception:
-                pass
+                transient = True
             
-            logger.info(f"  [LASTFM] No suitable matches found")
-            self.lastfm_cache[cache_key] = None
+            logger.info("  [LASTFM] No suitable matches found")
+            if transient:
+                self.lastfm_cache[cache_key] = None
+            else:
+                self._cache_put(self.lastfm_cache, cache_key, None)
             return None
             
         except Exception as e:
-            logger.warning(f"  [LASTFM] Last.fm lookup failed: {e}")
+            logger.warning("  [LASTFM] Last.fm lookup failed: %s", e)
             self.lastfm_cache[cache_key] = None
             return None
 
@@ -917,26 +1837,59 @@ class AdvancedMetadataLookup:
 class EnhancedWAVToFLACConverter:
     """Enhanced WAV to FLAC converter with advanced metadata handling."""
     
+    # Fixed attribute set: catches misspelt option names at assignment time
+    # and turns per-file attribute reads into slot lookups
+    __slots__ = (
+        'source_path', 'output_folder', 'compatibility_mode', 'compression_level',
+        'enable_metadata', 'aggressive_metadata', 'enable_fingerprinting', 'num_threads',
+        'force', 'conversion_workers', '_worker_cpus', 'ffmpeg_path',
+        'metadata_lookup', 'stats', '_stats_lock', '_dir_metadata', '_encoded_outputs',
+        '_up_to_date_sources',
+    )
+    
     def __init__(self, source_path: str, output_folder: str = "FLAC CONVERTER 2", 
                  compatibility_mode: bool = False, enable_metadata: bool = True,
-                 aggressive_metadata: bool = False, enable_fingerprinting: bool = True):
+                 aggressive_metadata: bool = False, enable_fingerprinting: bool = True,
+                 num_threads: int = 4, fpcalc_threads: int = 2,
+                 cache_path: Optional[Path] = DEFAULT_CACHE_PATH,
+                 conversion_workers: Optional[int] = None, pin_workers: bool = False,
+                 force: bool = False, compression_level: int = DEFAULT_COMPRESSION_LEVEL):
         self.source_path = Path(source_path)
         self.output_folder = output_folder
         self.compatibility_mode = compatibility_mode
+        self.compression_level = min(max(0, compression_level), MAX_COMPRESSION_LEVEL)
         self.enable_metadata = enable_metadata
         self.aggressive_metadata = aggressive_metadata
         self.enable_fingerprinting = enable_fingerprinting
+        self.num_threads = max(1, num_threads)
+        self.force = force  # Re-encode/re-copy even when the output is up to date
+        self.conversion_workers = max(1, conversion_workers or os.cpu_count() or 1)
+        # CPUs handed out round-robin to conversion threads (Linux only)
+        self._worker_cpus = None
+        if pin_workers:
+            if hasattr(os, 'sched_getaffinity'):
+                self._worker_cpus = cycle(sorted(os.sched_getaffinity(0)))
+            else:
+                logger.warning("CPU pinning is not supported on this platform, ignoring --affinity")
         
         # Verify source path exists
         if not self.source_path.exists():
             raise FileNotFoundError(f"Source path does not exist: {source_path}")
         
-        # Check if ffmpeg is available
-        if not which("ffmpeg"):
-            raise RuntimeError("ffmpeg not found. Please install ffmpeg and ensure it's in your PATH.")
+        # Files are encoded in-process by libsndfile; ffmpeg (resolved once) is
+        # the fallback for inputs it cannot read, and the only encoder without it
+        self.ffmpeg_path = shutil.which("ffmpeg")
+        if not self.ffmpeg_path:
+            if soundfile is None:
+                raise RuntimeError("ffmpeg not found. Please install ffmpeg and ensure it's in your PATH.")
+            logger.warning("ffmpeg not found - files libsndfile cannot read will fail to convert")
         
         # Initialize metadata lookup
-        self.metadata_lookup = AdvancedMetadataLookup(enable_fingerprinting=enable_fingerprinting) if enable_metadata else None
+        self.metadata_lookup = AdvancedMetadataLookup(
+            enable_fingerprinting=enable_fingerprinting,
+            fpcalc_threads=fpcalc_threads,
+            cache_path=cache_path
+        ) if enable_metadata else None
         
         # Statistics
         self.stats = {
@@ -944,6 +1897,7 @@ class EnhancedWAVToFLACConverter:
             'converted': 0,
             'failed': 0,
             'skipped_flac': 0,
+            'up_to_date': 0,
             'metadata_found': 0,
             'metadata_fallback': 0,
             'metadata_fingerprint': 0,
@@ -951,25 +1905,36 @@ class EnhancedWAVToFLACConverter:
             'metadata_complete': 0,
             'start_time': time.time()
         }
+        self._stats_lock = threading.Lock()
+        self._dir_metadata = {}  # file path -> parsed directory metadata, filled by prefetch_metadata
+        self._encoded_outputs = set()  # outputs encoded by this run, so known to carry no tags yet
+        self._up_to_date_sources = set()  # WAVs whose output was current; counted apart from 'converted'
         
-        logger.info(f"Enhanced WAV to FLAC Converter initialized")
-        logger.info(f"Source: {self.source_path}")
-        logger.info(f"Output: {self.output_folder}")
-        logger.info(f"Compatibility mode: {self.compatibility_mode}")
-        logger.info(f"Metadata enabled: {self.enable_metadata}")
-        logger.info(f"Audio fingerprinting: {self.enable_fingerprinting}")
+        logger.info("Enhanced WAV to FLAC Converter initialized")
+        logger.info("Source: %s", self.source_path)
+        logger.info("Output: %s", self.output_folder)
+        logger.info("Compatibility mode: %s", self.compatibility_mode)
+        logger.info("Compression level: %s", self.compression_level)
+        logger.info("Metadata enabled: %s", self.enable_metadata)
+        logger.info("Audio fingerprinting: %s", self.enable_fingerprinting)
+        logger.info("Conversion workers: %s", self.conversion_workers)
+        logger.info("Metadata threads: %s", self.num_threads)
+    
+    def _increment_stat(self, key: str):
+        """Increment a statistics counter (safe to call from worker threads)."""
+        with self._stats_lock:
+            self.stats[key] += 1
     
-    def find_audio_files(self) -> List[Path]:
+    def find_audio_files(self) -> List[AudioFileEntry]:
         """Find all WAV and FLAC files in the source directory."""
-        audio_files = []
-        for root, dirs, files in os.walk(self.source_path):
-            for file in files:
-                if file.lower().endswith(('.wav', '.flac')):
-                    audio_files.append(Path(root) / file)
-        
-        wav_count = sum(1 for f in audio_files if f.suffix.lower() == '.wav')
-        flac_count = sum(1 for f in audio_files if f.suffix.lower() == '.flac')
-        logger.info(f"Found {len(audio_files)} audio files ({wav_count} WAV, {flac_count} FLAC)")
+        audio_files = list(_scan_audio_files(self.source_path))
+        
+        wav_count = 0
+        for entry in audio_files:
+            if entry.path.suffix.lower() == '.wav':
+                wav_count += 1
+        flac_count = len(audio_files) - wav_count
+        logger.info("Found %s audio files (%s WAV, %s FLAC)", len(audio_files), wav_count, flac_count)
         return audio_files
     
     def get_relative_path(self, file_path: Path) -> Path:
@@ -987,111 +1952,143 @@ class EnhancedWAVToFLACConverter:
         try:
             audio_file = FLAC(flac_file)
             
-            # Clear existing metadata
-            audio_file.delete()
-            
-            # Standard tags
-            tag_mapping = {
-                'title': 'TITLE',
-                'artist': 'ARTIST',
-                'album': 'ALBUM',
-                'date': 'DATE',
-                'year': 'DATE',
-                'track_number': 'TRACKNUMBER',
-                'genre': 'GENRE',
-                'albumartist': 'ALBUMARTIST',
-                'composer': 'COMPOSER',
-                'comment': 'COMMENT',
-            }
-            
-            # MusicBrainz tags
-            mb_mapping = {
-                'musicbrainz_recordingid': 'MUSICBRAINZ_TRACKID',
-                'musicbrainz_albumid': 'MUSICBRAINZ_ALBUMID',
-                'musicbrainz_artistid': 'MUSICBRAINZ_ARTISTID',
-                'musicbrainz_releasegroupid': 'MUSICBRAINZ_RELEASEGROUPID',
-            }
+            # Clear existing metadata in memory; delete() would rewrite the file
+            # once more before the save() below
+            if audio_file.tags is None:
+                audio_file.add_tags()
+            else:
+                audio_file.tags.clear()
             
             # Add standard metadata
-            for key, flac_key in tag_mapping.items():
-                if key in metadata and metadata[key]:
-                    audio_file[flac_key] = metadata[key]
+            for key, flac_key in _STD_TAG_MAP:
+                value = metadata.get(key)
+                if value:
+                    audio_file[flac_key] = value
             
             # Add MusicBrainz metadata
-            for key, flac_key in mb_mapping.items():
-                if key in metadata and metadata[key]:
-                    audio_file[flac_key] = metadata[key]
+            for key, flac_key in _MB_TAG_MAP:
+                value = metadata.get(key)
+                if value:
+                    audio_file[flac_key] = value
             
             # Save metadata
             audio_file.save()
             
-            # Log embedded metadata
-            embedded_tags = []
-            for key, value in metadata.items():
-                if value:
-                    embedded_tags.append(f"{key}={value}")
+            # Log embedded metadata (only the first few are shown)
+            embedded_tags = list(islice((f"{key}={value}" for key, value in metadata.items() if value), 4))
             
             if embedded_tags:
-                logger.info(f"  [METADATA] Embedded: {', '.join(embedded_tags[:3])}{'...' if len(embedded_tags) > 3 else ''}")
+                logger.info("  [METADATA] Embedded: %s%s", ', '.join(embedded_tags[:3]), '...' if len(embedded_tags) > 3 else '')
             
             return True
             
         except Exception as e:
-            logger.error(f"  [METADATA_ERROR] Failed to embed metadata: {str(e)}")
+            logger.error("  [METADATA_ERROR] Failed to embed metadata: %s", e)
             return False
     
+    def _convert_with_soundfile(self, input_file: Path, output_file: Path) -> None:
+        """Encode a WAV file to FLAC in-process with libsndfile, streaming fixed-size blocks."""
+        subtype = 'PCM_16' if self.compatibility_mode else 'PCM_24'
+        # libsndfile takes 0.0-1.0 and maps it onto FLAC presets 0-8
+        level = min(self.compression_level, LIBSNDFILE_MAX_COMPRESSION_LEVEL) / LIBSNDFILE_MAX_COMPRESSION_LEVEL
+        with soundfile.SoundFile(str(input_file)) as source, \
+                soundfile.SoundFile(str(output_file), 'w', source.samplerate, source.channels,
+                                    subtype=subtype, format='FLAC', compression_level=level) as target:
+            # Integer reads of float data are not scaled (a full-scale sample
+            # reads as 0 or 1), so float sources are read as float and
+            # quantized to the target depth by libsndfile on write
+            is_float = source.subtype in ('FLOAT', 'DOUBLE')
+            # 64k-frame blocks keep memory flat regardless of file length
+            for block in source.blocks(blocksize=1 << 16, dtype='float64' if is_float else 'int32',
+                                       always_2d=True):
+                if is_float:
+                    # Float WAVs may exceed full scale; clip instead of wrapping around
+                    block.clip(-1.0, 1.0, out=block)
+                target.write(block)
+    
+    def _convert_with_ffmpeg(self, input_file: Path, output_file: Path) -> None:
+        """Encode a WAV file to FLAC with a single ffmpeg process, streaming disk to disk."""
+        if not self.ffmpeg_path:
+            raise RuntimeError("ffmpeg not found")
+        
+        # Compatibility mode: 16-bit; high quality mode: 32-bit
+        sample_fmt = "s16" if self.compatibility_mode else "s32"
+        
+        result = subprocess.run(
+            [self.ffmpeg_path, "-hide_banner", "-loglevel", "error", "-nostdin", "-y",
+             "-i", str(input_file),
+             "-compression_level", str(self.compression_level), "-sample_fmt", sample_fmt,
+             str(output_file)],
+            # Concurrent ffmpeg processes must not compete for the terminal's stdin
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+        )
+        if result.returncode != 0:
+            message = result.stderr.decode(errors='replace').strip()
+            raise RuntimeError(f"ffmpeg exited with status {result.returncode}: {message}")
+    
     def convert_wav_to_flac(self, input_file: Path, output_file: Path) -> bool:
         """Convert a single WAV file to FLAC."""
+        # Encode under a temporary name so an interrupted run never leaves a
+        # truncated file that a later run would treat as up to date
+        partial_file = output_file.with_name(output_file.stem + '.partial.flac')
         try:
-            # Load the WAV file
-            audio = AudioSegment.from_wav(str(input_file))
+            converted = False
             
-            # Set export parameters based on mode
-            if self.compatibility_mode:
-                # Compatibility mode: 16-bit, compression level 8
-                export_params = {
-                    "format": "flac",
-                    "parameters": [
-                        "-compression_level", "8",
-                        "-sample_fmt", "s16"
-                    ]
-                }
-                logger.info(f"  [CONVERT] Converting in compatibility mode (16-bit, level 8)")
-            else:
-                # High quality mode: 24-bit, compression level 12
-                export_params = {
-                    "format": "flac",
-                    "parameters": [
-                        "-compression_level", "12",
-                        "-sample_fmt", "s32"
-                    ]
-                }
-                logger.info(f"  [CONVERT] Converting in high quality mode (32-bit, level 12)")
+            if soundfile is not None:
+                if self.compatibility_mode:
+                    logger.debug("  [CONVERT] Converting in compatibility mode (16-bit, libsndfile)")
+                else:
+                    logger.debug("  [CONVERT] Converting in high quality mode (24-bit, libsndfile)")
+                try:
+                    self._convert_with_soundfile(input_file, partial_file)
+                    converted = True
+                except Exception as e:
+                    logger.warning("  [CONVERT] libsndfile could not convert file (%s), falling back to ffmpeg", e)
             
-            # Export to FLAC
-            audio.export(str(output_file), **export_params)
+            if not converted:
+                if self.compatibility_mode:
+                    logger.debug("  [CONVERT] Converting in compatibility mode (16-bit, ffmpeg)")
+                else:
+                    logger.debug("  [CONVERT] Converting in high quality mode (32-bit, ffmpeg)")
+                self._convert_with_ffmpeg(input_file, partial_file)
             
             # Verify the output file was created and has content
-            if output_file.exists() and output_file.stat().st_size > 0:
+            if partial_file.exists() and partial_file.stat().st_size > 0:
+                os.replace(partial_file, output_file)
+                
                 # Calculate compression ratio
                 input_size = input_file.stat().st_size
                 output_size = output_file.stat().st_size
                 compression_ratio = (1 - output_size / input_size) * 100
                 
-                logger.info(f"  [SUCCESS] Converted successfully (Compression: {compression_ratio:.1f}%)")
+                logger.info("  [SUCCESS] Converted successfully (Compression: %.1f%%)", compression_ratio)
                 return True
             else:
-                logger.error(f"  [ERROR] Output file was not created or is empty")
+                logger.error("  [ERROR] Output file was not created or is empty")
                 return False
                 
         except Exception as e:
-            logger.error(f"  [ERROR] Conversion failed: {str(e)}")
+            logger.error("  [ERROR] Conversion failed: %s", e)
+            return False
+        finally:
+            try:
+                partial_file.unlink()
+            except OSError:
+                pass
+    
+    def _output_is_current(self, entry: AudioFileEntry, output_file: Path) -> bool:
+        """Whether output_file exists, is non-empty and is at least as new as its source."""
+        try:
+            output_stat = output_file.stat()
+        except OSError:
             return False
+        return output_stat.st_size > 0 and output_stat.st_mtime_ns >= entry.stat.st_mtime_ns
     
-    def process_single_file(self, audio_file: Path) -> bool:
-        """Process a single audio file with conversion and metadata."""
+    def _convert_phase(self, entry: AudioFileEntry) -> Optional[Path]:
+        """Convert (or copy) a source file into the output tree; returns the output FLAC path or None on failure."""
+        audio_file = entry.path
         try:
-            relative_path = self.get_relative_path(audio_file)
+            relative_path = Path(*entry.relative_parts)
             output_dir = self.create_output_directory(relative_path)
             
             # Determine output file path
@@ -1101,29 +2098,74 @@ class EnhancedWAVToFLACConverter:
             else:  # Already FLAC
                 output_file = output_dir / audio_file.name
                 needs_conversion = False
-                logger.info(f"[PROCESSING] {relative_path} (FLAC - metadata only)")
+                logger.info("[PROCESSING] %s (FLAC - metadata only)", relative_path)
                 
-                # Copy FLAC file if it doesn't exist in output
-                if not output_file.exists():
-                    import shutil
+                # Copy FLAC file if it doesn't exist in output; copy2 uses the
+                # platform's kernel-side copy (sendfile/fcopyfile) where available
+                if self.force or not output_file.exists():
                     shutil.copy2(audio_file, output_file)
-                    logger.info(f"  [COPY] Copied existing FLAC file")
+                    logger.info("  [COPY] Copied existing FLAC file")
                 
-                self.stats['skipped_flac'] += 1
+                self._increment_stat('skipped_flac')
+            
+            if needs_conversion and not self.force and self._output_is_current(entry, output_file):
+                logger.info("[PROCESSING] %s (already converted)", relative_path)
+                self._increment_stat('up_to_date')
+                self._up_to_date_sources.add(audio_file)
+                needs_conversion = False
             
             if needs_conversion:
-                logger.info(f"[PROCESSING] {relative_path}")
+                logger.info("[PROCESSING] %s", relative_path)
                 # Convert WAV to FLAC
                 if not self.convert_wav_to_flac(audio_file, output_file):
-                    return False
+                    return None
+                self._encoded_outputs.add(output_file)
+                # Drop the source from the page cache unless it will be fingerprinted
+                if not self.enable_fingerprinting:
+                    _fadvise(audio_file, 'DONTNEED')
             
+            return output_file
+            
+        except Exception as e:
+            logger.error("[ERROR] Failed to process %s: %s", audio_file, e)
+            return None
+    
+    def _metadata_phase(self, entry: AudioFileEntry, output_file: Path) -> bool:
+        """Look up and embed metadata for a converted file."""
+        audio_file = entry.path
+        try:
             # Handle metadata if enabled
             if self.enable_metadata and self.metadata_lookup:
-                # Get existing metadata from the output FLAC file
-                existing_metadata = self.metadata_lookup.get_existing_metadata(output_file)
+                prefetched_metadata = self._dir_metadata.pop(audio_file, None)
+                freshly_encoded = output_file in self._encoded_outputs
+                self._encoded_outputs.discard(output_file)
                 
-                # Parse directory structure
-                dir_metadata = self.metadata_lookup.parse_directory_structure(audio_file, self.source_path)
+                # Tagged on an earlier run and neither file has changed since
+                if not freshly_encoded and self.metadata_lookup.was_tagged(audio_file, entry.stat, output_file):
+                    logger.info("  [UNCHANGED] Already tagged on a previous run, skipping lookup")
+                    self._increment_stat('metadata_complete')
+                    return True
+                
+                # Get existing metadata from the output FLAC file; one encoded
+                # just now has none, so skip opening it before embed_metadata does
+                if freshly_encoded:
+                    existing_metadata = {}
+                else:
+                    existing_metadata = self.metadata_lookup.get_existing_metadata(output_file)
+                
+                # Already tagged - no directory parsing or lookups needed
+                if self.metadata_lookup._is_metadata_complete(existing_metadata):
+                    logger.info("  [COMPLETE] Metadata has MusicBrainz ID, skipping lookup")
+                    self._increment_stat('metadata_complete')
+                    self.metadata_lookup.mark_tagged(audio_file, entry.stat, output_file)
+                    return True
+                
+                # Parse directory structure (reusing the prefetch pass when available)
+                dir_metadata = prefetched_metadata
+                if dir_metadata is None:
+                    dir_metadata = self.metadata_lookup.parse_directory_structure(
+                        audio_file, self.source_path, entry.relative_parts
+                    )
                 
                 # Check if we need to do metadata lookup
                 track_number = int(dir_metadata['track_number']) if dir_metadata['track_number'].isdigit() else None
@@ -1136,7 +2178,8 @@ class EnhancedWAVToFLACConverter:
                     track_number=track_number,
                     is_generic=dir_metadata.get('is_generic', False),
                     file_path=audio_file,  # Use original file for fingerprinting
-                    existing_metadata=existing_metadata
+                    existing_metadata=existing_metadata,
+                    file_stat=entry.stat
                 )
                 
                 # Add any additional directory metadata
@@ -1146,16 +2189,18 @@ class EnhancedWAVToFLACConverter:
                     metadata['track_number'] = dir_metadata['track_number']
                 
                 # Update statistics based on metadata source
+                identified = True
                 if metadata == existing_metadata:
-                    self.stats['metadata_complete'] += 1
+                    self._increment_stat('metadata_complete')
                 elif metadata.get('acoustid_score'):
-                    self.stats['metadata_fingerprint'] += 1
+                    self._increment_stat('metadata_fingerprint')
                 elif metadata.get('lastfm_confidence'):
-                    self.stats['metadata_lastfm'] += 1
+                    self._increment_stat('metadata_lastfm')
                 elif metadata.get('musicbrainz_recordingid'):
-                    self.stats['metadata_found'] += 1
+                    self._increment_stat('metadata_found')
                 else:
-                    self.stats['metadata_fallback'] += 1
+                    self._increment_stat('metadata_fallback')
+                    identified = False
                 
                 # Embed metadata (only if it's different from existing or we have improvements)
                 should_update_metadata = (
@@ -1165,16 +2210,70 @@ class EnhancedWAVToFLACConverter:
                 )
                 
                 if should_update_metadata:
-                    self.embed_metadata(output_file, metadata)
+                    tagged = self.embed_metadata(output_file, metadata)
                 else:
-                    logger.info(f"  [METADATA] No updates needed - metadata already complete")
+                    logger.info("  [METADATA] No updates needed - metadata already complete")
+                    tagged = True
+                
+                # Directory-only fallbacks are retried next run in case a lookup failed transiently
+                if tagged and identified:
+                    self.metadata_lookup.mark_tagged(audio_file, entry.stat, output_file)
             
             return True
             
         except Exception as e:
-            logger.error(f"[ERROR] Failed to process {audio_file}: {str(e)}")
+            logger.error("[ERROR] Failed to process metadata for %s: %s", audio_file, e)
             return False
     
+    def prefetch_metadata(self, audio_files: List[AudioFileEntry]):
+        """
+        Group files by their parsed (artist, album) and prefetch lookups per album.
+        
+        Each multi-track album's tracklist is fetched once, and generic files
+        from the whole library (which are fingerprinted first) are identified
+        up front with batched AcoustID requests.
+        """
+        albums = {}
+        for entry in audio_files:
+            audio_file = entry.path
+            # Already-tagged FLAC sources will skip lookup entirely
+            if (audio_file.suffix.lower() == '.flac' and
+                    self.metadata_lookup._is_metadata_complete(self.metadata_lookup.get_existing_metadata(audio_file))):
+                continue
+            dir_metadata = self.metadata_lookup.parse_directory_structure(
+                audio_file, self.source_path, entry.relative_parts
+            )
+            self._dir_metadata[audio_file] = dir_metadata
+            albums.setdefault((dir_metadata['artist'], dir_metadata['album']), []).append(
+                (entry, dir_metadata)
+            )
+        
+        # A single-file album is cheaper to look up individually
+        multi_track_albums = [key for key, files in albums.items() if len(files) > 1 and all(key)]
+        if multi_track_albums:
+            logger.info("Prefetching tracklists for %s albums...", len(multi_track_albums))
+            for artist, album in multi_track_albums:
+                if self.metadata_lookup.cancelled.is_set():
+                    return
+                self.metadata_lookup.prefetch_album(artist, album)
+        
+        if self.metadata_lookup.fingerprint_enabled and not self.metadata_lookup.cancelled.is_set():
+            generic_entries = [entry for files in albums.values() for entry, dir_metadata in files
+                               if dir_metadata.get('is_generic')]
+            if len(generic_entries) > 1:
+                self.metadata_lookup.audio_fingerprint_lookup_batch(
+                    [entry.path for entry in generic_entries],
+                    {entry.path: entry.stat for entry in generic_entries}
+                )
+    
+    def _pin_conversion_thread(self):
+        """Pin the calling conversion thread (and the ffmpeg processes it starts) to one CPU."""
+        cpu = next(self._worker_cpus)
+        try:
+            os.sched_setaffinity(0, {cpu})  # 0 is the calling thread on Linux
+        except OSError as e:
+            logger.warning("Could not pin conversion thread to CPU %s: %s", cpu, e)
+    
     def convert_all(self) -> Tuple[int, int]:
         """Convert all WAV files in the source directory."""
         audio_files = self.find_audio_files()
@@ -1184,23 +2283,109 @@ class EnhancedWAVToFLACConverter:
             logger.warning("No audio files found in the source directory")
             return 0, 0
         
-        logger.info(f"Starting conversion of {len(audio_files)} files...")
+        # Start the largest files first so a long encode is not left running
+        # alone at the end of the batch
+        audio_files.sort(key=lambda entry: entry.stat.st_size, reverse=True)
+        
+        use_metadata = self.enable_metadata and self.metadata_lookup
+        
+        logger.info("Starting conversion of %s files...", len(audio_files))
         logger.info("=" * 80)
         
-        for i, audio_file in enumerate(audio_files, 1):
-            logger.info(f"\n[{i}/{len(audio_files)}] Processing file {i} of {len(audio_files)}")
+        # Encoding (ffmpeg/libsndfile, outside the GIL) and metadata lookups
+        # (network-bound) run in separate pools: each converted file is handed
+        # to the metadata pool while the next ones are still encoding. The
+        # album/fingerprint prefetch also runs alongside the first encodes;
+        # converted files wait for it before their own lookup starts.
+        pin = self._pin_conversion_thread if self._worker_cpus is not None else None
+        convert_pool = ThreadPoolExecutor(max_workers=self.conversion_workers, initializer=pin)
+        metadata_pool = ThreadPoolExecutor(max_workers=self.num_threads)
+        interrupted = False
+        try:
+            jobs = {convert_pool.submit(self._convert_phase, entry): ('convert', entry)
+                    for entry in audio_files}
+            prefetching = use_metadata
+            if prefetching:
+                jobs[metadata_pool.submit(self.prefetch_metadata, audio_files)] = ('prefetch', None)
+            awaiting_prefetch = []
+            pending = set(jobs)
             
-            if self.process_single_file(audio_file):
-                self.stats['converted'] += 1
-            else:
-                self.stats['failed'] += 1
+            # Ask the kernel to start reading upcoming inputs while the current
+            # ones encode; one more is hinted each time an encode finishes
+            lookahead = iter(audio_files[self.conversion_workers:])
+            for upcoming in islice(lookahead, self.conversion_workers):
+                _fadvise(upcoming.path, 'WILLNEED', PREFETCH_BYTES)
+            finished = 0
             
-            # Progress update every 10 files
-            if i % 10 == 0:
-                elapsed = time.time() - self.stats['start_time']
-                avg_time = elapsed / i
-                remaining = (len(audio_files) - i) * avg_time
-                logger.info(f"\n[PROGRESS] {i}/{len(audio_files)} files processed. ETA: {remaining/60:.1f} minutes")
+            try:
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        phase, entry = jobs.pop(future)
+                    
+                        if phase == 'prefetch':
+                            try:
+                                future.result()
+                            except Exception as e:
+                                logger.warning("[PREFETCH] Metadata prefetch failed, looking up files individually: %s", e)
+                            prefetching = False
+                            for waiting_entry, output_file in awaiting_prefetch:
+                                metadata_future = metadata_pool.submit(self._metadata_phase, waiting_entry, output_file)
+                                jobs[metadata_future] = ('metadata', waiting_entry)
+                                pending.add(metadata_future)
+                            awaiting_prefetch.clear()
+                            continue
+                    
+                        if phase == 'convert':
+                            upcoming = next(lookahead, None)
+                            if upcoming is not None:
+                                _fadvise(upcoming.path, 'WILLNEED', PREFETCH_BYTES)
+                            output_file = future.result()
+                            if output_file is not None and use_metadata:
+                                if prefetching:
+                                    awaiting_prefetch.append((entry, output_file))
+                                else:
+                                    metadata_future = metadata_pool.submit(self._metadata_phase, entry, output_file)
+                                    jobs[metadata_future] = ('metadata', entry)
+                                    pending.add(metadata_future)
+                                continue
+                            success = output_file is not None
+                        else:
+                            success = future.result()
+                    
+                        if not success:
+                            self._increment_stat('failed')
+                        elif (entry.path.suffix.lower() == '.wav' and
+                                entry.path not in self._up_to_date_sources):
+                            # FLAC sources are counted under 'skipped_flac'
+                            self._increment_stat('converted')
+                    
+                        finished += 1
+                        logger.info("[%s/%s] Finished: %s", finished, len(audio_files), entry.path.name)
+                    
+                        # Progress update every 10 files
+                        if finished % 10 == 0:
+                            elapsed = time.time() - self.stats['start_time']
+                            avg_time = elapsed / finished
+                            remaining = (len(audio_files) - finished) * avg_time
+                            logger.info("\n[PROGRESS] %s/%s files processed. ETA: %.1f minutes", finished, len(audio_files), remaining / 60)
+        
+            except KeyboardInterrupt:
+                # Cancel the queued futures and tell a running prefetch to stop
+                # at its next album or batch, so exiting only waits for the
+                # steps already in flight (ffmpeg/fpcalc children receive the
+                # same SIGINT)
+                interrupted = True
+                if use_metadata:
+                    self.metadata_lookup.cancelled.set()
+                for future in pending:
+                    future.cancel()
+                raise
+        finally:
+            # Unlike leaving a with-block, an interrupt does not block here on
+            # the futures still running
+            for pool in (convert_pool, metadata_pool):
+                _shutdown_pool(pool, wait=not interrupted)
         
         return self.stats['converted'], self.stats['failed']
     
@@ -1214,6 +2399,7 @@ class EnhancedWAVToFLACConverter:
         print(f"Total files found:      {self.stats['total_files']}")
         print(f"WAV files converted:    {self.stats['converted']}")
         print(f"FLAC files processed:   {self.stats['skipped_flac']}")
+        print(f"Already up to date:     {self.stats['up_to_date']}")
         print(f"Failed conversions:     {self.stats['failed']}")
         
         if self.enable_metadata:
@@ -1229,13 +2415,71 @@ class EnhancedWAVToFLACConverter:
         print(f"Average time per file:  {elapsed/max(1, self.stats['total_files']):.1f} seconds")
         
         if self.stats['total_files'] > 0:
-            success_rate = ((self.stats['converted'] + self.stats['skipped_flac']) / self.stats['total_files']) * 100
+            succeeded = self.stats['converted'] + self.stats['skipped_flac'] + self.stats['up_to_date']
+            success_rate = (succeeded / self.stats['total_files']) * 100
             print(f"Success rate:           {success_rate:.1f}%")
         
         print(f"\nOutput location: {Path.cwd() / self.output_folder}")
         print("=" * 80)
 
 
+class MetadataMode(IntEnum):
+    """How much metadata work to do; each level includes the ones below it."""
+    OFF = 0
+    BASIC = 1
+    AGGRESSIVE = 2
+    FINGERPRINT = 3
+
+
+class _RaiseMetadataLevel(argparse.Action):
+    """Raise --metadata to at least this flag's level, so shortcut flags combine in any order."""
+    
+    def __init__(self, option_strings, dest, const, **kwargs):
+        super().__init__(option_strings, dest, nargs=0, const=const, **kwargs)
+    
+    def __call__(self, parser, namespace, values, option_string=None):
+        current = MetadataMode[getattr(namespace, self.dest).upper()]
+        setattr(namespace, self.dest, max(current, self.const).name.lower())
+
+
+class _PassthroughQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue records unformatted.
+    
+    The stock prepare() formats the message on the emitting thread so the
+    record can be pickled; the listener here runs in the same process, so
+    that work is left to it.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def setup_logging(verbose: bool = False, log_file: str = 'conversion_enhanced.log') -> logging.handlers.QueueListener:
+    """
+    Route log records through a queue so formatting and file/console I/O happen
+    on a background thread instead of in the worker threads.
+    
+    Per-step tracing is logged at DEBUG and only shown with --verbose.
+    Returns the started listener; stop() it to flush before exiting.
+    """
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    handlers = [logging.FileHandler(log_file), logging.StreamHandler()]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    log_queue = queue.Queue(-1)
+    root = logging.getLogger()
+    root.addHandler(_PassthroughQueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+    # Only this module's tracing; urllib3/musicbrainzngs debug output stays off
+    logger.setLevel(logging.DEBUG if verbose else logging.INFO)
+    
+    listener = logging.handlers.QueueListener(log_queue, *handlers)
+    listener.start()
+    return listener
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Enhanced WAV to FLAC Converter with Advanced Metadata Lookup and Audio Fingerprinting',
@@ -1245,7 +2489,7 @@ Examples:
   python wav_to_flac_converter_enhanced.py "C:\\Music\\WAV Files"
   python wav_to_flac_converter_enhanced.py "/path/to/wav/files" --compatibility
   python wav_to_flac_converter_enhanced.py "./music" --no-metadata
-  python wav_to_flac_converter_enhanced.py "./music" --aggressive-metadata --fingerprinting
+  python wav_to_flac_converter_enhanced.py "./music" --metadata fingerprint
 
 Features:
   - Intelligent metadata lookup for international artists
@@ -1268,37 +2512,96 @@ Features:
     
     parser.add_argument('--compatibility', '-c',
                        action='store_true',
-                       help='Use compatibility mode (16-bit, compression level 8) for better device support')
+                       help='Use compatibility mode (16-bit) for better device support')
+    
+    parser.add_argument('--compression',
+                       type=int,
+                       choices=range(0, MAX_COMPRESSION_LEVEL + 1),
+                       default=DEFAULT_COMPRESSION_LEVEL,
+                       metavar='LEVEL',
+                       help=f'FLAC compression level 0-{MAX_COMPRESSION_LEVEL}; higher is smaller but slower, '
+                            f'and in-process encoding caps at {LIBSNDFILE_MAX_COMPRESSION_LEVEL} '
+                            f'(default: {DEFAULT_COMPRESSION_LEVEL})')
+    
+    parser.add_argument('--metadata', '-m',
+                       choices=[mode.name.lower() for mode in MetadataMode],
+                       default='basic',
+                       help='Metadata lookup level: off, basic, aggressive (more API calls) or '
+                            'fingerprint (also identify unknown tracks by audio; requires internet) (default: basic)')
     
+    # Shortcuts for --metadata: -a/-f raise the level, --no-fingerprinting caps
+    # it below fingerprint and -n overrides everything, whatever the order
     parser.add_argument('--no-metadata', '-n',
                        action='store_true',
-                       help='Disable automatic metadata lookup')
+                       help='Disable automatic metadata lookup (same as --metadata off)')
     
     parser.add_argument('--aggressive-metadata', '-a',
-                       action='store_true',
-                       help='Use aggressive metadata search (more API calls, better results)')
+                       action=_RaiseMetadataLevel, dest='metadata', const=MetadataMode.AGGRESSIVE,
+                       help='Use at least --metadata aggressive')
     
     parser.add_argument('--fingerprinting', '-f',
-                       action='store_true',
-                       help='Enable audio fingerprinting for unknown tracks (requires internet)')
+                       action=_RaiseMetadataLevel, dest='metadata', const=MetadataMode.FINGERPRINT,
+                       help='Use --metadata fingerprint')
     
     parser.add_argument('--no-fingerprinting',
                        action='store_true',
                        help='Disable audio fingerprinting even if metadata is enabled')
     
+    parser.add_argument('--num-threads', '-t',
+                       type=int,
+                       default=4,
+                       help='Number of metadata lookup threads (default: 4)')
+    
+    parser.add_argument('--jobs', '-j',
+                       type=int,
+                       default=None,
+                       help='Number of files encoded in parallel (default: one per CPU)')
+    
+    parser.add_argument('--affinity',
+                       action='store_true',
+                       help='Pin each encoding worker to its own CPU (Linux only)')
+    
+    parser.add_argument('--fpcalc-threads',
+                       type=int,
+                       default=2,
+                       help='Maximum concurrent audio fingerprint calculations (default: 2)')
+    
+    parser.add_argument('--force',
+                       action='store_true',
+                       help='Re-encode and re-copy files even when the output is newer than the source')
+    
+    parser.add_argument('--no-cache',
+                       action='store_true',
+                       help=f'Do not read or write the persistent lookup cache ({DEFAULT_CACHE_PATH})')
+    
+    parser.add_argument('-v', '--verbose',
+                       action='store_true',
+                       help='Log per-file lookup and conversion steps (DEBUG level)')
+    
     args = parser.parse_args()
+    listener = setup_logging(args.verbose)
     
-    # Determine fingerprinting setting
-    enable_fingerprinting = args.fingerprinting and not args.no_fingerprinting and not args.no_metadata
+    metadata_mode = MetadataMode[args.metadata.upper()]
+    if args.no_fingerprinting:
+        metadata_mode = min(metadata_mode, MetadataMode.AGGRESSIVE)
+    if args.no_metadata:
+        metadata_mode = MetadataMode.OFF
     
     try:
         converter = EnhancedWAVToFLACConverter(
             source_path=args.source_path,
             output_folder=args.output,
             compatibility_mode=args.compatibility,
-            enable_metadata=not args.no_metadata,
-            aggressive_metadata=args.aggressive_metadata,
-            enable_fingerprinting=enable_fingerprinting
+            enable_metadata=metadata_mode >= MetadataMode.BASIC,
+            aggressive_metadata=metadata_mode >= MetadataMode.AGGRESSIVE,
+            enable_fingerprinting=metadata_mode >= MetadataMode.FINGERPRINT,
+            num_threads=args.num_threads,
+            fpcalc_threads=args.fpcalc_threads,
+            conversion_workers=args.jobs,
+            pin_workers=args.affinity,
+            force=args.force,
+            compression_level=args.compression,
+            cache_path=None if args.no_cache else DEFAULT_CACHE_PATH
         )
         
         converted, failed = converter.convert_all()
@@ -1311,8 +2614,10 @@ Features:
         logger.info("\nConversion interrupted by user")
         sys.exit(130)
     except Exception as e:
-        logger.error(f"Error: {str(e)}")
+        logger.error("Error: %s", e)
         sys.exit(1)
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":